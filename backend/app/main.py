@@ -22,7 +22,7 @@ from app.models.error import ErrorResponse
 from app.handlers.multimodal import MultimodalHandler
 from app.services.service_manager import get_service_manager
 from config.settings import get_settings
-from config.logging import get_logger, get_request_logger, get_service_logger, get_metrics_collector
+from config.logging import get_logger, get_logging_context
 
 
 logger = get_logger(__name__)
@@ -35,9 +35,9 @@ async def lifespan(app: FastAPI):
     logger.info("Starting FirstAidVox Backend...")
     
     try:
-        # Initialize service manager and all external services
+        # Connect external services in the background; /health/ready reports completion
         service_manager = get_service_manager()
-        await service_manager.initialize_all()
+        service_manager.start(timeout=get_settings().request_timeout_seconds)
         
         # Store service manager in app state
         app.state.service_manager = service_manager
@@ -103,11 +103,12 @@ def create_app() -> FastAPI:
         request.state.request_id = request_id
         
         # Get logging utilities
-        request_logger = get_request_logger()
-        metrics_collector = get_metrics_collector()
+        logging_context = get_logging_context()
+        request_logger = logging_context.request
+        metrics_collector = logging_context.metrics
         
         # Log request start
-        start_time = time.time()
+        start_ns = time.monotonic_ns()
         client_ip = request.client.host if request.client else "unknown"
         user_agent = request.headers.get("user-agent")
         
@@ -131,8 +132,8 @@ def create_app() -> FastAPI:
             response = await call_next(request)
             
             # Calculate response time
-            process_time = time.time() - start_time
-            response_time_ms = process_time * 1000
+            elapsed_ns = time.monotonic_ns() - start_ns
+            response_time_ms = elapsed_ns / 1_000_000
             
             # Record metrics
             metrics_collector.record_response_time(response_time_ms)
@@ -146,14 +147,13 @@ def create_app() -> FastAPI:
             
             # Add request ID to response headers
             response.headers["X-Request-ID"] = request_id
-            response.headers["X-Response-Time"] = f"{process_time:.3f}s"
+            response.headers["X-Response-Time"] = f"{elapsed_ns / 1_000_000_000:.3f}s"
             
             return response
             
         except Exception as e:
             # Calculate response time for errors
-            process_time = time.time() - start_time
-            response_time_ms = process_time * 1000
+            response_time_ms = (time.monotonic_ns() - start_ns) / 1_000_000
             
             # Record error metrics
             metrics_collector.increment_error_count()
@@ -301,6 +301,36 @@ def create_app() -> FastAPI:
                 content=error_health
             )
     
+    # Liveness probe: never touches external services
+    @app.get("/health/live", response_model=dict)
+    async def liveness_check():
+        """Report that the process is up and serving requests."""
+        return {"status": "alive"}
+    
+    # Readiness probe: ready once all external services are connected
+    @app.get("/health/ready", response_model=dict)
+    async def readiness_check(request: Request):
+        """
+        Report whether the service can handle traffic.
+        
+        Returns 503 until all external service connections are available.
+        """
+        service_manager = getattr(app.state, "service_manager", None)
+        connection_status = {}
+        if service_manager is not None and await service_manager.wait_ready(0):
+            # A cache miss runs blocking connection probes, so keep them off the event loop
+            connection_status = await asyncio.to_thread(service_manager.validate_all_connections)
+        ready = bool(connection_status) and all(connection_status.values())
+        
+        return JSONResponse(
+            status_code=200 if ready else 503,
+            content={
+                "status": "ready" if ready else "not_ready",
+                "services": connection_status,
+                "request_id": getattr(request.state, 'request_id', 'unknown')
+            }
+        )
+    
     # Metrics endpoint for monitoring
     @app.get("/metrics", response_model=dict)
     async def metrics_endpoint(request: Request):
@@ -310,7 +340,7 @@ def create_app() -> FastAPI:
         Returns performance metrics, request counts, and service health data.
         """
         try:
-            metrics_collector = get_metrics_collector()
+            metrics_collector = get_logging_context().metrics
             service_manager = app.state.service_manager
             
             # Get application metrics
@@ -370,7 +400,7 @@ def create_app() -> FastAPI:
         """
         try:
             # Get logging utilities
-            request_logger = get_request_logger()
+            request_logger = get_logging_context().request
             request_id = getattr(request.state, 'request_id', 'unknown')
             
             # Log input summary (sanitized)
@@ -437,7 +467,7 @@ def create_app() -> FastAPI:
         """
         try:
             # Get logging utilities
-            request_logger = get_request_logger()
+            request_logger = get_logging_context().request
             request_id = getattr(request.state, 'request_id', 'unknown')
             
             # Extract request data
@@ -14,7 +14,7 @@ from vertexai.generative_models import GenerativeModel, Part
 from google.oauth2 import service_account
 
 from config.settings import get_settings
-from config.logging import get_service_logger, get_metrics_collector
+from config.logging import get_logging_context
 from app.models.internal import AIResponse, FunctionCall
 from app.services.search_service import VertexSearchClient
 
@@ -239,8 +239,9 @@ class GeminiClient:
             raise ValueError("Text input cannot be empty")
         
         # Get logging utilities
-        service_logger = get_service_logger()
-        metrics_collector = get_metrics_collector()
+        logging_context = get_logging_context()
+        service_logger = logging_context.service
+        metrics_collector = logging_context.metrics
         
         start_time = time.time()
         
@@ -14,7 +14,6 @@ from vertexai.generative_models import GenerativeModel, Part
 from google.oauth2 import service_account
 
 from config.settings import get_settings
-from config.logging import get_service_logger, get_metrics_collector
 from app.models.internal import AIResponse, FunctionCall
 from app.services.search_service import VertexSearchClient
 
@@ -3,21 +3,30 @@ Google Maps Places API service integration for hospital and pharmacy search.
 Implements secure authentication and location-based search functionality.
 """
 
+import asyncio
+import heapq
 import logging
 import math
 import time
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 import googlemaps
 from googlemaps.exceptions import ApiError, Timeout, TransportError
 
 from config.settings import get_settings
-from config.logging import get_service_logger, get_metrics_collector
+from config.logging import get_logging_context
 from app.models.hospital import HospitalResult
 from app.models.location import Location
 
 
 logger = logging.getLogger(__name__)
 
+# Kilometers per degree, used by the equirectangular distance approximation
+KM_PER_DEGREE_LATITUDE = 110.574
+KM_PER_DEGREE_LONGITUDE_AT_EQUATOR = 111.320
+
+# How long a geocoding-based connection check is reused before probing again
+VALIDATION_CACHE_TTL_SECONDS = 60.0
+
 
 class GoogleMapsClient:
     """
@@ -30,6 +39,7 @@ class GoogleMapsClient:
         self.settings = get_settings()
         self._client = None
         self._api_key = self.settings.google_maps_api_key
+        self._last_validation: Optional[Tuple[float, bool]] = None
     
     async def initialize(self) -> None:
         """
@@ -45,6 +55,7 @@ class GoogleMapsClient:
                 key=self._api_key,
                 timeout=self.settings.request_timeout_seconds
             )
+            self._last_validation = None
             
             logger.info("Initialized Google Maps Places API client")
             
@@ -56,11 +67,26 @@ class GoogleMapsClient:
         """
         Validate that the Google Maps API connection is working.
         Returns True if connection is valid, False otherwise.
+        
+        The result of the billable geocoding probe is reused for
+        VALIDATION_CACHE_TTL_SECONDS so frequent health checks don't hit the API.
         """
+        if not self._client:
+            return False
+        
+        now = time.monotonic()
+        if self._last_validation is not None:
+            checked_at, is_valid = self._last_validation
+            if now - checked_at < VALIDATION_CACHE_TTL_SECONDS:
+                return is_valid
+        
+        is_valid = self._probe_connection()
+        self._last_validation = (now, is_valid)
+        return is_valid
+    
+    def _probe_connection(self) -> bool:
+        """Issue a live geocoding request to check API access."""
         try:
-            if not self._client:
-                return False
-            
             # Test connection with a simple geocoding request
             # Using a well-known location to test API access
             test_result = self._client.geocode("1600 Amphitheatre Parkway, Mountain View, CA")
@@ -101,15 +127,15 @@ class GoogleMapsClient:
         }
         
         try:
-            start_time = time.time()
+            start_time = time.monotonic()
             
-            # Check API access
-            if self.validate_connection():
+            # Check API access; the geocoding probe is blocking I/O, so keep it off the event loop
+            if await asyncio.to_thread(self.validate_connection):
                 health_info["authenticated"] = True
                 health_info["api_accessible"] = True
             
             # Calculate response time
-            response_time = (time.time() - start_time) * 1000
+            response_time = (time.monotonic() - start_time) * 1000
             health_info["response_time_ms"] = round(response_time, 2)
             
         except Exception as e:
@@ -142,21 +168,23 @@ class GoogleMapsClient:
         if not self._client:
             raise ConnectionError("Google Maps client not initialized")
         
-        # Validate coordinates
-        if not (-90 <= latitude <= 90):
-            raise ValueError(f"Invalid latitude: {latitude}. Must be between -90 and 90")
-        
-        if not (-180 <= longitude <= 180):
-            raise ValueError(f"Invalid longitude: {longitude}. Must be between -180 and 180")
-        
-        if radius_km <= 0 or radius_km > 50:
+        # Validate coordinates with a single check; only narrow down the cause on failure
+        if not (-90 <= latitude <= 90 and -180 <= longitude <= 180 and 0 < radius_km <= 50):
+            if not (-90 <= latitude <= 90):
+                raise ValueError(f"Invalid latitude: {latitude}. Must be between -90 and 90")
+            if not (-180 <= longitude <= 180):
+                raise ValueError(f"Invalid longitude: {longitude}. Must be between -180 and 180")
             raise ValueError(f"Invalid radius: {radius_km}. Must be between 1 and 50 km")
         
+        user_location = (latitude, longitude)
+        radius_meters = int(radius_km * 1000)  # Convert km to meters
+        
         # Get logging utilities
-        service_logger = get_service_logger()
-        metrics_collector = get_metrics_collector()
+        logging_context = get_logging_context()
+        service_logger = logging_context.service
+        metrics_collector = logging_context.metrics
         
-        start_time = time.time()
+        start_time = time.monotonic()
         
         try:
             # Log service call start
@@ -168,9 +196,6 @@ class GoogleMapsClient:
             # Increment service call count
             metrics_collector.increment_service_call("google_maps")
             
-            user_location = (latitude, longitude)
-            radius_meters = int(radius_km * 1000)  # Convert km to meters
-            
             results = []
             
             # Search for hospitals
@@ -187,74 +212,56 @@ class GoogleMapsClient:
                 type='pharmacy'
             )
             
-            # Process hospital results
-            for place in hospital_results.get('results', []):
-                try:
-                    place_location = place.get('geometry', {}).get('location', {})
-                    place_lat = place_location.get('lat')
-                    place_lng = place_location.get('lng')
-                    
-                    if place_lat is None or place_lng is None:
+            # Collect lightweight (distance, order, ...) candidates for every place;
+            # HospitalResult models are only built for the results we return
+            candidates = []
+            for place_type, place_results in (
+                ('hospital', hospital_results),
+                ('pharmacy', pharmacy_results),
+            ):
+                for place in place_results.get('results', []):
+                    try:
+                        place_location = place.get('geometry', {}).get('location', {})
+                        place_lat = place_location.get('lat')
+                        place_lng = place_location.get('lng')
+                        
+                        if place_lat is None or place_lng is None:
+                            continue
+                        
+                        distance_km = round(
+                            self._calculate_distance(latitude, longitude, place_lat, place_lng), 2
+                        )
+                        
+                        # Insertion order breaks distance ties, keeping the ordering stable
+                        candidates.append(
+                            (distance_km, len(candidates), place_type, place, place_lat, place_lng)
+                        )
+                        
+                    except Exception as e:
+                        logger.warning(f"Failed to process {place_type} result: {e}")
                         continue
-                    
-                    distance_km = self._calculate_distance(
-                        latitude, longitude, place_lat, place_lng
-                    )
-                    
-                    hospital_result = HospitalResult(
-                        name=place.get('name', 'Unknown'),
-                        address=place.get('vicinity', 'Address not available'),
-                        distance_km=round(distance_km, 2),
-                        place_id=place.get('place_id', ''),
-                        rating=place.get('rating'),
-                        place_type='hospital',
-                        latitude=place_lat,
-                        longitude=place_lng
-                    )
-                    
-                    results.append(hospital_result)
-                    
-                except Exception as e:
-                    logger.warning(f"Failed to process hospital result: {e}")
-                    continue
             
-            # Process pharmacy results
-            for place in pharmacy_results.get('results', []):
+            # Pop the closest candidates until we have the top 10 valid results
+            heapq.heapify(candidates)
+            while candidates and len(results) < 10:
+                distance_km, _, place_type, place, place_lat, place_lng = heapq.heappop(candidates)
                 try:
-                    place_location = place.get('geometry', {}).get('location', {})
-                    place_lat = place_location.get('lat')
-                    place_lng = place_location.get('lng')
-                    
-                    if place_lat is None or place_lng is None:
-                        continue
-                    
-                    distance_km = self._calculate_distance(
-                        latitude, longitude, place_lat, place_lng
-                    )
-                    
-                    pharmacy_result = HospitalResult(
+                    results.append(HospitalResult(
                         name=place.get('name', 'Unknown'),
                         address=place.get('vicinity', 'Address not available'),
-                        distance_km=round(distance_km, 2),
+                        distance_km=distance_km,
                         place_id=place.get('place_id', ''),
                         rating=place.get('rating'),
-                        place_type='pharmacy',
+                        place_type=place_type,
                         latitude=place_lat,
                         longitude=place_lng
-                    )
-                    
-                    results.append(pharmacy_result)
-                    
+                    ))
                 except Exception as e:
-                    logger.warning(f"Failed to process pharmacy result: {e}")
+                    logger.warning(f"Failed to process {place_type} result: {e}")
                     continue
             
-            # Sort by distance and limit results
-            results.sort(key=lambda x: x.distance_km)
-            results = results[:10]  # Limit to top 10 results
-            
             # Calculate response time
-            response_time_ms = (time.time() - start_time) * 1000
+            response_time_ms = (time.monotonic() - start_time) * 1000
             
             # Log successful service call
             service_logger.log_service_call_end(
@@ -269,7 +276,7 @@ class GoogleMapsClient:
             
         except (ApiError, Timeout, TransportError) as e:
             # Calculate response time for errors
-            response_time_ms = (time.time() - start_time) * 1000
+            response_time_ms = (time.monotonic() - start_time) * 1000
             
             # Log service error
             service_logger.log_service_error(
@@ -286,7 +293,7 @@ class GoogleMapsClient:
             raise ConnectionError(f"Hospital search failed: {e}") from e
         except Exception as e:
             # Calculate response time for errors
-            response_time_ms = (time.time() - start_time) * 1000
+            response_time_ms = (time.monotonic() - start_time) * 1000
             
             # Log service error
             service_logger.log_service_error(
@@ -310,8 +317,10 @@ class GoogleMapsClient:
         lon2: float
     ) -> float:
         """
-        Calculate the great circle distance between two points on Earth.
-        Uses the Haversine formula for accurate distance calculation.
+        Calculate the distance between two nearby points on Earth.
+        Uses the equirectangular approximation, which stays within 1% of the
+        great circle distance at the search radii used here (<= 50km) and needs a
+        single cosine instead of the Haversine's sin/cos/asin chain.
         
         Args:
             lat1, lon1: Latitude and longitude of first point
@@ -320,23 +329,18 @@ class GoogleMapsClient:
         Returns:
             Distance in kilometers
         """
-        # Convert latitude and longitude from degrees to radians
-        lat1, lon1, lat2, lon2 = map(math.radians, [lat1, lon1, lat2, lon2])
-        
-        # Haversine formula
-        dlat = lat2 - lat1
-        dlon = lon2 - lon1
-        a = math.sin(dlat/2)**2 + math.cos(lat1) * math.cos(lat2) * math.sin(dlon/2)**2
-        c = 2 * math.asin(math.sqrt(a))
+        # Wrap the longitude delta into [-180, 180) so points across the antimeridian stay close
+        dlon = (lon2 - lon1 + 180.0) % 360.0 - 180.0
         
-        # Radius of Earth in kilometers
-        r = 6371
+        x = dlon * math.cos(math.radians(lat1)) * KM_PER_DEGREE_LONGITUDE_AT_EQUATOR
+        y = (lat2 - lat1) * KM_PER_DEGREE_LATITUDE
         
-        return c * r
+        return math.sqrt(x * x + y * y)
     
     async def close(self) -> None:
         """Clean up resources and close connections."""
         if self._client:
             # Google Maps client doesn't require explicit cleanup
             self._client = None
+            self._last_validation = None
             logger.info("Google Maps client connection closed")
\ No newline at end of file
@@ -3,9 +3,11 @@ Vertex AI Search service for medical document retrieval.
 Implements RAG (Retrieval-Augmented Generation) functionality.
 """
 
+import asyncio
 import os
 import logging
-from typing import List, Dict, Any, Optional
+from itertools import islice
+from typing import AsyncIterator, List, Dict, Any, Optional
 from google.cloud import discoveryengine_v1 as discoveryengine
 from google.api_core.client_options import ClientOptions
 from google.oauth2 import service_account
@@ -13,6 +15,11 @@ from config.settings import get_settings
 
 logger = logging.getLogger(__name__)
 
+# Upper bounds applied while extracting documents; the RAG context only uses
+# the first 1000 characters of content, so anything past these is discarded.
+MAX_CONTENT_CHARS = 1024
+MAX_SNIPPETS = 5
+
 
 class VertexSearchClient:
     """Client for Vertex AI Search to retrieve medical documents."""
@@ -22,6 +29,7 @@ class VertexSearchClient:
         self.settings = get_settings()
         self._client = None
         self._initialized = False
+        self._serving_config = None
         
         # Constants from settings
         self.PROJECT_ID = self.settings.google_cloud_project_id
@@ -32,6 +40,11 @@ class VertexSearchClient:
         logger.info(f"Using location: {self.LOCATION}")
         logger.info(f"Using engine ID: {self.ENGINE_ID}")
     
+    @property
+    def is_initialized(self) -> bool:
+        """Whether initialize() has completed and the client can serve searches."""
+        return self._initialized
+    
     def _build_serving_config(self) -> str:
         """Build serving config path using Engine ID (App ID)."""
         collection = "default_collection"
@@ -44,7 +57,7 @@ class VertexSearchClient:
             f"/servingConfigs/{serving_config_id}"
         )
         
-        logger.info(f"Generated serving config (Engine): {serving_config}")
+        logger.debug("Generated serving config (Engine): %s", serving_config)
         return serving_config
     
     async def initialize(self) -> None:
@@ -75,12 +88,15 @@ class VertexSearchClient:
                 else None
             )
             
-            # Initialize the search client
-            self._client = discoveryengine.SearchServiceClient(
+            # Initialize the async search client (grpc.aio, one multiplexed channel)
+            self._client = discoveryengine.SearchServiceAsyncClient(
                 credentials=credentials,
                 client_options=client_options
             )
             
+            # Serving config path is fixed for the client's lifetime
+            self._serving_config = self._build_serving_config()
+            
             # Skip connection test to avoid infinite loop
             logger.warning("⚠️ Skipping connection test to avoid infinite loop - will test in health_check")
             # await self._test_connection()
@@ -95,12 +111,9 @@ class VertexSearchClient:
     async def _test_connection(self) -> None:
         """Test the connection to Vertex AI Search."""
         try:
-            # Use the new serving config builder
-            serving_config = self._build_serving_config()
-            
             # Create search request with ContentSearchSpec for snippets
             request = discoveryengine.SearchRequest(
-                serving_config=serving_config,
+                serving_config=self._serving_config,
                 query="test",
                 page_size=1,
                 content_search_spec=discoveryengine.SearchRequest.ContentSearchSpec(
@@ -111,9 +124,8 @@ class VertexSearchClient:
             )
             
             # Add timeout to prevent hanging
-            import asyncio
             response = await asyncio.wait_for(
-                asyncio.to_thread(self._client.search, request=request),
+                self._client.search(request=request),
                 timeout=10.0  # 10 second timeout
             )
             logger.info("✅ Vertex AI Search connection test successful")
@@ -122,6 +134,42 @@ class VertexSearchClient:
             logger.error(f"Vertex AI Search connection test failed: {e}")
             raise
     
+    def _build_search_request(
+        self, query: str, max_results: int
+    ) -> discoveryengine.SearchRequest:
+        """Build a search request with snippets, query expansion and spell correction."""
+        # Create search request with ContentSearchSpec for snippets
+        request = discoveryengine.SearchRequest(
+            serving_config=self._serving_config,
+            query=query,
+            page_size=max_results,
+            content_search_spec=discoveryengine.SearchRequest.ContentSearchSpec(
+                snippet_spec=discoveryengine.SearchRequest.ContentSearchSpec.SnippetSpec(
+                    return_snippet=True
+                ),
+            ),
+            query_expansion_spec=discoveryengine.SearchRequest.QueryExpansionSpec(
+                condition=discoveryengine.SearchRequest.QueryExpansionSpec.Condition.AUTO
+            ),
+            spell_correction_spec=discoveryengine.SearchRequest.SpellCorrectionSpec(
+                mode=discoveryengine.SearchRequest.SpellCorrectionSpec.Mode.AUTO
+            )
+        )
+        return request
+    
+    async def _execute_search(
+        self, request: discoveryengine.SearchRequest
+    ) -> Any:
+        """Run a search request, converting timeouts into ConnectionError."""
+        try:
+            return await asyncio.wait_for(
+                self._client.search(request=request),
+                timeout=15.0  # 15 second timeout
+            )
+        except asyncio.TimeoutError:
+            logger.error("Search request timed out")
+            raise ConnectionError("Search request timed out")
+    
     async def search_medical_documents(
         self, 
         query: str, 
@@ -139,53 +187,52 @@ class VertexSearchClient:
         Returns:
             List of search results with document content and metadata
         """
+        return [
+            document_data
+            async for document_data in self.search_medical_documents_stream(
+                query, max_results, include_snippets
+            )
+        ]
+    
+    async def search_medical_documents_stream(
+        self,
+        query: str,
+        max_results: int = 5,
+        include_snippets: bool = True
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Search for medical documents, yielding the results one at a time.
+        
+        Same results as search_medical_documents: the first page is fetched in a
+        single unary call and its documents are then yielded in order, so this
+        is an iterator interface, not a streaming transport.
+        
+        Args:
+            query: The search query (medical symptoms, conditions, etc.)
+            max_results: Maximum number of results to return
+            include_snippets: Whether to include document snippets
+            
+        Yields:
+            Search results with document content and metadata
+        """
         if not self._initialized:
             await self.initialize()
         
         try:
             logger.info(f"Searching medical documents for query: '{query}'")
             
-            # Construct the serving config path using new builder
-            serving_config = self._build_serving_config()
-            
-            # Create search request with ContentSearchSpec for snippets
-            request = discoveryengine.SearchRequest(
-                serving_config=serving_config,
-                query=query,
-                page_size=max_results,
-                content_search_spec=discoveryengine.SearchRequest.ContentSearchSpec(
-                    snippet_spec=discoveryengine.SearchRequest.ContentSearchSpec.SnippetSpec(
-                        return_snippet=True
-                    ),
-                ),
-                query_expansion_spec=discoveryengine.SearchRequest.QueryExpansionSpec(
-                    condition=discoveryengine.SearchRequest.QueryExpansionSpec.Condition.AUTO
-                ),
-                spell_correction_spec=discoveryengine.SearchRequest.SpellCorrectionSpec(
-                    mode=discoveryengine.SearchRequest.SpellCorrectionSpec.Mode.AUTO
-                )
-            )
-            
-            # Execute search with timeout
-            import asyncio
-            try:
-                response = await asyncio.wait_for(
-                    asyncio.to_thread(self._client.search, request=request),
-                    timeout=15.0  # 15 second timeout
-                )
-            except asyncio.TimeoutError:
-                logger.error("Search request timed out")
-                raise ConnectionError("Search request timed out")
+            request = self._build_search_request(query, max_results)
+            response = await self._execute_search(request)
             
-            # Process results
-            results = []
+            # Only the first page is consumed
+            found = 0
             for result in response.results:
                 document_data = self._extract_document_data(result, include_snippets)
                 if document_data:
-                    results.append(document_data)
+                    found += 1
+                    yield document_data
             
-            logger.info(f"Found {len(results)} relevant medical documents")
-            return results
+            logger.info(f"Found {found} relevant medical documents")
             
         except Exception as e:
             logger.error(f"Error searching medical documents: {e}")
@@ -231,11 +278,11 @@ class VertexSearchClient:
                 
                 # Extract content
                 if 'content' in struct_data:
-                    doc_data["content"] = str(struct_data['content'])
+                    doc_data["content"] = str(struct_data['content'])[:MAX_CONTENT_CHARS]
                 elif 'description' in struct_data:
-                    doc_data["content"] = str(struct_data['description'])
+                    doc_data["content"] = str(struct_data['description'])[:MAX_CONTENT_CHARS]
                 elif 'text' in struct_data:
-                    doc_data["content"] = str(struct_data['text'])
+                    doc_data["content"] = str(struct_data['text'])[:MAX_CONTENT_CHARS]
                 
                 # Extract additional metadata
                 for key, value in struct_data.items():
@@ -244,15 +291,16 @@ class VertexSearchClient:
             
             # Extract snippet if available and requested
             if include_snippets and hasattr(search_result, 'document_snippets'):
-                snippets = []
-                for snippet in search_result.document_snippets:
-                    if hasattr(snippet, 'snippet'):
-                        snippets.append(snippet.snippet)
-                doc_data["snippet"] = " ".join(snippets)
+                snippets = (
+                    snippet.snippet
+                    for snippet in search_result.document_snippets
+                    if hasattr(snippet, 'snippet')
+                )
+                doc_data["snippet"] = " ".join(islice(snippets, MAX_SNIPPETS))
             
             # Fallback to document content if no structured data
             if not doc_data["content"] and hasattr(document, 'json_data'):
-                doc_data["content"] = str(document.json_data)
+                doc_data["content"] = str(document.json_data)[:MAX_CONTENT_CHARS]
             
             return doc_data if doc_data["content"] or doc_data["title"] else None
             
@@ -276,22 +324,21 @@ class VertexSearchClient:
         context_parts = ["=== RELEVANT MEDICAL INFORMATION ===\n"]
         
         for i, result in enumerate(results, 1):
-            context_parts.append(f"Document {i}:")
-            
-            if result.get("title"):
-                context_parts.append(f"Title: {result['title']}")
-            
-            if result.get("content"):
+            title = result.get("title")
+            content = result.get("content")
+            snippet = result.get("snippet")
+            
+            # Trailing newline leaves an empty line between documents
+            document = f"Document {i}:\n"
+            if title:
+                document += f"Title: {title}\n"
+            if content:
                 # Limit content length to avoid token limits
-                content = result["content"]
-                if len(content) > 1000:
-                    content = content[:1000] + "..."
-                context_parts.append(f"Content: {content}")
-            
-            if result.get("snippet"):
-                context_parts.append(f"Key Information: {result['snippet']}")
+                document += f"Content: {content[:1000]}{'...' if len(content) > 1000 else ''}\n"
+            if snippet:
+                document += f"Key Information: {snippet}\n"
             
-            context_parts.append("")  # Empty line between documents
+            context_parts.append(document)
         
         context_parts.append("=== END MEDICAL INFORMATION ===")
         
@@ -339,7 +386,8 @@ class VertexSearchClient:
         """Clean up the search client connection."""
         try:
             if self._client:
-                # Discovery Engine client doesn't have explicit close method
+                # Close the underlying grpc.aio channel
+                await self._client.transport.close()
                 self._client = None
             self._initialized = False
             logger.info("Vertex AI Search client closed")
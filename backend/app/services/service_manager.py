@@ -3,15 +3,64 @@ Service manager for coordinating Google Cloud service integrations.
 Handles initialization, validation, and lifecycle management of external services.
 """
 
+import asyncio
+import copy
 import logging
+import random
+import threading
 import time
-from typing import Dict, Any
+from contextlib import suppress
+from typing import Dict, Any, Optional, Tuple
 from .ai_service import GeminiClient
 from .location_service import GoogleMapsClient
 
 
 logger = logging.getLogger(__name__)
 
+# How long health results are reused before the underlying clients are checked again
+HEALTH_CACHE_TTL_SECONDS = 5.0
+DETAILED_HEALTH_CACHE_TTL_SECONDS = 15.0
+
+# Interval between background health snapshots taken after startup
+HEALTH_REFRESH_INTERVAL_SECONDS = 30.0
+
+# Health reported before initialize_all completes; callers receive deep copies
+_UNINITIALIZED_HEALTH: Dict[str, Any] = {
+    "initialized": False,
+    "services": {
+        "vertex_ai": {
+            "connected": False,
+            "service": "Google Cloud Vertex AI",
+            "model": "gemini-1.5-flash-001"
+        },
+        "google_maps": {
+            "connected": False,
+            "service": "Google Maps Places API",
+            "features": ["hospital_search", "pharmacy_search"]
+        }
+    },
+    "all_services_healthy": False
+}
+
+_UNINITIALIZED_DETAILED_HEALTH: Dict[str, Any] = {
+    "status": "not_initialized",
+    "initialized": False,
+    "all_services_healthy": False,
+    "summary": {
+        "total_services": 2,
+        "healthy_services": 0,
+        "degraded_services": 2
+    }
+}
+
+# Client initialization is retried with exponential backoff plus jitter
+INIT_RETRY_ATTEMPTS = 4
+INIT_RETRY_BASE_DELAY_SECONDS = 1.0
+INIT_RETRY_MAX_DELAY_SECONDS = 8.0
+
+# Default bound on closing clients; Cloud Run allows 10 s between SIGTERM and SIGKILL
+SHUTDOWN_TIMEOUT_SECONDS = 8.0
+
 
 class ServiceManager:
     """
@@ -24,35 +73,154 @@ class ServiceManager:
         self.gemini_client = GeminiClient()
         self.maps_client = GoogleMapsClient()
         self._initialized = False
+        self._health_cache: Optional[Tuple[float, Dict[str, bool]]] = None
+        self._detailed_health_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+        self._init_task: Optional[asyncio.Task] = None
+        self._refresh_task: Optional[asyncio.Task] = None
+        self._latest_health: Dict[str, Any] = {}
     
-    async def initialize_all(self) -> None:
+    async def initialize_all(self, timeout: Optional[float] = None) -> None:
         """
         Initialize all external service clients.
         Validates credentials and establishes secure connections.
         
+        Args:
+            timeout: Maximum seconds to wait for all clients, or None to wait indefinitely
+        
         Raises:
-            ConnectionError: If any service fails to initialize
+            ConnectionError: If any service fails to initialize or the timeout expires
         """
+        logger.info("Initializing external service clients...")
+        
+        # Vertex AI Gemini and Google Maps handshakes are independent, so run them concurrently
         try:
-            logger.info("Initializing external service clients...")
-            
-            # Initialize Vertex AI Gemini client
-            await self.gemini_client.initialize()
-            
-            # Initialize Google Maps client
-            await self.maps_client.initialize()
-            
-            self._initialized = True
-            logger.info("All external service clients initialized successfully")
-            
-        except Exception as e:
-            logger.error(f"Failed to initialize service clients: {e}")
+            results = await asyncio.wait_for(
+                asyncio.gather(
+                    self._initialize_with_retry("vertex_ai", self.gemini_client.initialize),
+                    self._initialize_with_retry("google_maps", self.maps_client.initialize),
+                    return_exceptions=True
+                ),
+                timeout=timeout
+            )
+        except asyncio.TimeoutError as e:
+            logger.error("Service initialization timed out after %ss", timeout)
             await self.cleanup()
-            raise ConnectionError(f"Service initialization failed: {e}") from e
+            raise ConnectionError(f"Service initialization timed out after {timeout}s") from e
+        
+        failures = {
+            name: result
+            for name, result in zip(("vertex_ai", "google_maps"), results)
+            if isinstance(result, BaseException)
+        }
+        
+        if failures:
+            for name, error in failures.items():
+                logger.error("Failed to initialize %s client: %s", name, error)
+            await self.cleanup()
+            details = "; ".join(f"{name}: {error}" for name, error in failures.items())
+            raise ConnectionError(f"Service initialization failed: {details}") from next(iter(failures.values()))
+        
+        self._initialized = True
+        self._invalidate_health_cache()
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._refresh_loop())
+        logger.info("All external service clients initialized successfully")
+    
+    def start(self, timeout: Optional[float] = None) -> asyncio.Task:
+        """
+        Begin initializing all clients in the background.
+        
+        Returns immediately so the application can answer liveness probes while
+        the clients connect; use wait_ready to observe completion.
+        
+        Args:
+            timeout: Maximum seconds to wait for all clients, or None to wait indefinitely
+        
+        Returns:
+            The task running initialize_all
+        """
+        if self._init_task is None or self._init_task.done():
+            self._init_task = asyncio.create_task(self.initialize_all(timeout=timeout))
+            self._init_task.add_done_callback(self._log_init_result)
+        return self._init_task
+    
+    @staticmethod
+    def _log_init_result(task: asyncio.Task) -> None:
+        """Retrieve the background initialization outcome so failures are logged once."""
+        if task.cancelled():
+            return
+        error = task.exception()
+        if error is not None:
+            logger.error("Background service initialization failed: %s", error)
+    
+    async def wait_ready(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for background initialization to finish.
+        
+        Args:
+            timeout: Maximum seconds to wait; 0 checks without waiting
+        
+        Returns:
+            True if all clients are initialized, False on timeout or failure
+        """
+        if self._init_task is None:
+            return self._initialized
+        
+        try:
+            # Shield so a timed-out waiter doesn't cancel initialization itself
+            await asyncio.wait_for(asyncio.shield(self._init_task), timeout=timeout)
+        except asyncio.TimeoutError:
+            return False
+        except Exception:
+            return False
+        return self._initialized
+    
+    async def _initialize_with_retry(self, name: str, initialize) -> None:
+        """
+        Run a client's initialize coroutine, retrying transient failures.
+        
+        Args:
+            name: Service name used in log messages
+            initialize: Coroutine function that initializes the client
+        
+        Raises:
+            Exception: The last failure once INIT_RETRY_ATTEMPTS are exhausted
+        """
+        for attempt in range(INIT_RETRY_ATTEMPTS):
+            try:
+                await initialize()
+                return
+            except Exception as e:
+                if attempt == INIT_RETRY_ATTEMPTS - 1:
+                    raise
+                # Half fixed, half random so restarting instances don't retry in lockstep
+                backoff = min(INIT_RETRY_MAX_DELAY_SECONDS, INIT_RETRY_BASE_DELAY_SECONDS * 2 ** attempt)
+                delay = backoff / 2 + random.uniform(0, backoff / 2)
+                logger.warning(
+                    "Initializing %s client failed (attempt %d/%d): %s; retrying in %.1fs",
+                    name, attempt + 1, INIT_RETRY_ATTEMPTS, e, delay
+                )
+                await asyncio.sleep(delay)
+    
+    async def _refresh_loop(self) -> None:
+        """Periodically store a detailed health snapshot for probe endpoints."""
+        while True:
+            try:
+                self._latest_health = await self.get_detailed_health_status()
+            except Exception as e:
+                logger.warning("Background health refresh failed: %s", e)
+            await asyncio.sleep(HEALTH_REFRESH_INTERVAL_SECONDS)
+    
+    def _invalidate_health_cache(self) -> None:
+        """Drop cached health results so the next check queries the clients."""
+        self._health_cache = None
+        self._detailed_health_cache = None
     
     def validate_all_connections(self) -> Dict[str, bool]:
         """
         Validate all service connections.
+        Results are reused for HEALTH_CACHE_TTL_SECONDS so bursts of health
+        probes don't each hit the external services.
         
         Returns:
             Dictionary mapping service names to their connection status
@@ -63,6 +231,12 @@ class ServiceManager:
                 "google_maps": False
             }
         
+        now = time.monotonic()
+        if self._health_cache is not None:
+            checked_at, cached_status = self._health_cache
+            if now - checked_at < HEALTH_CACHE_TTL_SECONDS:
+                return dict(cached_status)
+        
         try:
             vertex_ai_status = self.gemini_client.validate_connection()
             maps_status = self.maps_client.validate_connection()
@@ -72,11 +246,12 @@ class ServiceManager:
                 "google_maps": maps_status
             }
             
-            logger.info(f"Service connection validation: {status}")
-            return status
+            logger.info("Service connection validation: %s", status)
+            self._health_cache = (now, status)
+            return dict(status)
             
         except Exception as e:
-            logger.error(f"Service validation failed: {e}")
+            logger.error("Service validation failed: %s", e)
             return {
                 "vertex_ai": False,
                 "google_maps": False
@@ -89,7 +264,18 @@ class ServiceManager:
         Returns:
             Dictionary containing service health information
         """
-        connection_status = self.validate_all_connections()
+        if not self._initialized:
+            return copy.deepcopy(_UNINITIALIZED_HEALTH)
+        
+        services = self._latest_health.get("services")
+        if services:
+            # Prefer the background snapshot so probes don't trigger client checks
+            connection_status = {
+                name: services.get(name, {}).get("healthy", False)
+                for name in ("vertex_ai", "google_maps")
+            }
+        else:
+            connection_status = self.validate_all_connections()
         
         return {
             "initialized": self._initialized,
@@ -111,21 +297,35 @@ class ServiceManager:
     async def get_detailed_health_status(self) -> Dict[str, Any]:
         """
         Get detailed health status with comprehensive service checks.
+        Results are reused for DETAILED_HEALTH_CACHE_TTL_SECONDS.
         
         Returns:
             Dictionary containing detailed service health information
         """
+        if not self._initialized:
+            health = copy.deepcopy(_UNINITIALIZED_DETAILED_HEALTH)
+            health["timestamp"] = time.time()
+            return health
+        
+        now = time.monotonic()
+        if self._detailed_health_cache is not None:
+            checked_at, cached_health = self._detailed_health_cache
+            if now - checked_at < DETAILED_HEALTH_CACHE_TTL_SECONDS:
+                return copy.deepcopy(cached_health)
+        
         try:
-            # Get detailed health checks from each service
-            vertex_ai_health = await self.gemini_client.health_check()
-            maps_health = await self.maps_client.health_check()
+            # Get detailed health checks from each service concurrently
+            vertex_ai_health, maps_health = await asyncio.gather(
+                self.gemini_client.health_check(),
+                self.maps_client.health_check()
+            )
             
             # Determine overall health
             vertex_healthy = vertex_ai_health.get("authenticated", False) and vertex_ai_health.get("model_accessible", False)
             maps_healthy = maps_health.get("authenticated", False) and maps_health.get("api_accessible", False)
             all_healthy = vertex_healthy and maps_healthy
             
-            return {
+            health = {
                 "status": "healthy" if all_healthy else "degraded",
                 "initialized": self._initialized,
                 "timestamp": time.time(),
@@ -147,8 +347,11 @@ class ServiceManager:
                 }
             }
             
+            self._detailed_health_cache = (now, health)
+            return copy.deepcopy(health)
+            
         except Exception as e:
-            logger.error(f"Failed to get detailed health status: {e}")
+            logger.error("Failed to get detailed health status: %s", e)
             return {
                 "status": "unhealthy",
                 "initialized": self._initialized,
@@ -157,31 +360,66 @@ class ServiceManager:
                 "all_services_healthy": False
             }
     
-    async def cleanup(self) -> None:
-        """Clean up all service connections and resources."""
+    async def cleanup(self, timeout: Optional[float] = SHUTDOWN_TIMEOUT_SECONDS) -> None:
+        """
+        Clean up all service connections and resources.
+        
+        Args:
+            timeout: Maximum seconds to wait for the clients to close, or None to wait indefinitely
+        """
         try:
             logger.info("Cleaning up service connections...")
             
-            if hasattr(self, 'gemini_client'):
-                await self.gemini_client.close()
+            # initialize_all cleans up from inside the init task on failure; that
+            # task must not cancel itself and has to stay visible to wait_ready
+            if self._init_task is not None and self._init_task is not asyncio.current_task():
+                if not self._init_task.done():
+                    self._init_task.cancel()
+                    with suppress(asyncio.CancelledError):
+                        await self._init_task
+                self._init_task = None
             
-            if hasattr(self, 'maps_client'):
-                await self.maps_client.close()
+            if self._refresh_task is not None:
+                self._refresh_task.cancel()
+                with suppress(asyncio.CancelledError):
+                    await self._refresh_task
+                self._refresh_task = None
+            
+            # Close both clients concurrently so one slow client can't use up the shutdown window
+            results = await asyncio.wait_for(
+                asyncio.gather(
+                    self.gemini_client.close(),
+                    self.maps_client.close(),
+                    return_exceptions=True
+                ),
+                timeout=timeout
+            )
+            for name, result in zip(("vertex_ai", "google_maps"), results):
+                if isinstance(result, BaseException):
+                    logger.error("Error closing %s client: %s", name, result)
             
-            self._initialized = False
             logger.info("Service cleanup completed")
             
+        except asyncio.TimeoutError:
+            logger.error("Service cleanup timed out after %ss", timeout)
         except Exception as e:
-            logger.error(f"Error during service cleanup: {e}")
+            logger.error("Error during service cleanup: %s", e)
+        finally:
+            self._initialized = False
+            self._invalidate_health_cache()
+            self._latest_health = {}
 
 
 # Global service manager instance
 service_manager = None
+_service_manager_lock = threading.Lock()
 
 
 def get_service_manager() -> ServiceManager:
     """Get the global service manager instance, creating it if needed."""
     global service_manager
     if service_manager is None:
-        service_manager = ServiceManager()
+        with _service_manager_lock:
+            if service_manager is None:
+                service_manager = ServiceManager()
     return service_manager
\ No newline at end of file
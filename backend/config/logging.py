@@ -6,76 +6,128 @@ Provides structured logging for requests, external service calls, and errors.
 import logging
 import logging.config
 import logging.handlers
+import atexit
+import copy
+import queue
 import sys
-from typing import Dict, Any
+import threading
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
-import json
 import time
 import uuid
+from collections import Counter
 from contextvars import ContextVar
+from dataclasses import dataclass
+from functools import lru_cache
+
+import orjson
 
 from .settings import get_settings
 
 
 # Context variables for request tracking
 request_id_var: ContextVar[str] = ContextVar('request_id', default='')
-request_start_time_var: ContextVar[float] = ContextVar('request_start_time', default=0.0)
+# Monotonic start time of the current request in nanoseconds (time.monotonic_ns)
+request_start_time_var: ContextVar[int] = ContextVar('request_start_time', default=0)
+
+
+# Record attributes copied into structured log entries when present
+_EXTRA_FIELDS = (
+    "request_id",
+    "service_name",
+    "response_time_ms",
+    "endpoint",
+    "status_code",
+    "client_ip",
+    "user_agent",
+    "method",
+    "input_summary",
+)
+_MISSING = object()
+
+# Per-thread log entry dict reused across StructuredFormatter.format calls
+_entry_buffers = threading.local()
 
 
 class StructuredFormatter(logging.Formatter):
     """Custom formatter that outputs structured JSON logs."""
     
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # (epoch second, formatted "YYYY-MM-DDTHH:MM:SS") reused within the same second
+        self._cached_second = (None, "")
+    
+    def _format_timestamp(self, created: float, msecs: float) -> str:
+        """Format a record creation time as an ISO 8601 UTC string."""
+        second = int(created)
+        cached_second, prefix = self._cached_second
+        if cached_second != second:
+            prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+            self._cached_second = (second, prefix)
+        return f"{prefix}.{int(msecs):03d}Z"
+    
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as structured JSON."""
-        log_entry = {
-            "timestamp": datetime.utcnow().isoformat() + "Z",
-            "level": record.levelname,
-            "logger": record.name,
-            "message": record.getMessage(),
-        }
-        
-        # Add request ID from context if available
-        request_id = request_id_var.get('')
-        if request_id:
-            log_entry["request_id"] = request_id
-        
-        # Add extra fields if present
-        if hasattr(record, "request_id"):
-            log_entry["request_id"] = record.request_id
-        
-        if hasattr(record, "service_name"):
-            log_entry["service_name"] = record.service_name
-        
-        if hasattr(record, "response_time_ms"):
-            log_entry["response_time_ms"] = record.response_time_ms
-        
-        if hasattr(record, "endpoint"):
-            log_entry["endpoint"] = record.endpoint
-        
-        if hasattr(record, "status_code"):
-            log_entry["status_code"] = record.status_code
-        
-        if hasattr(record, "client_ip"):
-            log_entry["client_ip"] = record.client_ip
-        
-        if hasattr(record, "user_agent"):
-            log_entry["user_agent"] = record.user_agent
+        # Borrow this thread's entry dict; a nested format call (e.g. from a str()
+        # fallback that logs) finds the slot empty and allocates its own.
+        log_entry = getattr(_entry_buffers, "entry", None)
+        if log_entry is None:
+            log_entry = {}
+        else:
+            _entry_buffers.entry = None
         
-        if hasattr(record, "method"):
-            log_entry["method"] = record.method
-        
-        if hasattr(record, "input_summary"):
-            log_entry["input_summary"] = record.input_summary
-        
-        # Add exception info if present
-        if record.exc_info:
-            log_entry["exception"] = self.formatException(record.exc_info)
-        
-        # Add stack trace for errors
-        if record.levelno >= logging.ERROR and record.stack_info:
-            log_entry["stack_trace"] = record.stack_info
-        
-        return json.dumps(log_entry, ensure_ascii=False)
+        try:
+            log_entry["timestamp"] = self._format_timestamp(record.created, record.msecs)
+            log_entry["level"] = record.levelname
+            log_entry["logger"] = record.name
+            log_entry["message"] = record.getMessage() if record.args else str(record.msg)
+            
+            # Add request ID from context if available
+            request_id = request_id_var.get('')
+            if request_id:
+                log_entry["request_id"] = request_id
+            
+            # Add extra fields if present
+            for field in _EXTRA_FIELDS:
+                value = getattr(record, field, _MISSING)
+                if value is not _MISSING:
+                    log_entry[field] = value
+            
+            # Add exception info if present
+            if record.exc_info:
+                log_entry["exception"] = self.formatException(record.exc_info)
+            
+            # Add stack trace for errors
+            if record.levelno >= logging.ERROR and record.stack_info:
+                log_entry["stack_trace"] = record.stack_info
+            
+            # orjson emits UTF-8 directly; unknown extra values fall back to str()
+            # and non-str dict keys are stringified as json.dumps did
+            return orjson.dumps(log_entry, default=str, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+        finally:
+            log_entry.clear()
+            _entry_buffers.entry = log_entry
+
+
+class _PrintableFilter(dict):
+    """
+    str.translate table that deletes non-printable characters.
+    
+    HTTP header values arrive Latin-1 decoded, so only those code points are
+    cached; anything wider is evaluated per lookup to keep the table bounded.
+    """
+    
+    def __missing__(self, codepoint: int):
+        value = codepoint if chr(codepoint).isprintable() else None
+        if codepoint < 256:
+            self[codepoint] = value
+        return value
+
+
+_PRINTABLE_ONLY = _PrintableFilter()
+
+# User agents longer than this are truncated in request logs
+MAX_USER_AGENT_LENGTH = 200
 
 
 class RequestLogger:
@@ -88,15 +140,21 @@ class RequestLogger:
         """Log the start of a request with sanitized information."""
         # Set context variables
         request_id_var.set(request_id)
-        request_start_time_var.set(time.time())
+        request_start_time_var.set(time.monotonic_ns())
+        
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
         
         # Sanitize user agent (remove non-printable characters)
         sanitized_user_agent = None
         if user_agent:
-            sanitized_user_agent = ''.join(c for c in user_agent if c.isprintable())[:200]
+            # Bound the work on pathological headers before filtering
+            sanitized_user_agent = (
+                user_agent[:MAX_USER_AGENT_LENGTH * 2].translate(_PRINTABLE_ONLY)[:MAX_USER_AGENT_LENGTH]
+            )
         
         self.logger.info(
-            f"Request started - {method} {path}",
+            "Request started - %s %s", method, path,
             extra={
                 "request_id": request_id,
                 "method": method,
@@ -109,8 +167,11 @@ class RequestLogger:
     
     def log_request_end(self, request_id: str, status_code: int, response_time_ms: float):
         """Log the completion of a request with timing information."""
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        
         self.logger.info(
-            f"Request completed - Status: {status_code}, Time: {response_time_ms:.1f}ms",
+            "Request completed - Status: %s, Time: %.1fms", status_code, response_time_ms,
             extra={
                 "request_id": request_id,
                 "status_code": status_code,
@@ -121,8 +182,11 @@ class RequestLogger:
     
     def log_request_error(self, request_id: str, error: Exception, response_time_ms: float = None):
         """Log request errors with context information."""
+        if not self.logger.isEnabledFor(logging.ERROR):
+            return
+        
         self.logger.error(
-            f"Request failed - {type(error).__name__}: {str(error)}",
+            "Request failed - %s: %s", type(error).__name__, error,
             extra={
                 "request_id": request_id,
                 "error_type": type(error).__name__,
@@ -135,6 +199,9 @@ class RequestLogger:
     
     def log_input_summary(self, request_id: str, input_type: str, input_size: int, has_image: bool = False):
         """Log sanitized input summary without exposing sensitive data."""
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        
         summary = {
             "type": input_type,
             "text_length": input_size,
@@ -143,7 +210,7 @@ class RequestLogger:
         }
         
         self.logger.info(
-            f"Input processed - Type: {input_type}, Size: {input_size} chars",
+            "Input processed - Type: %s, Size: %s chars", input_type, input_size,
             extra={
                 "request_id": request_id,
                 "input_summary": summary,
@@ -160,11 +227,14 @@ class ServiceLogger:
     
     def log_service_call_start(self, service_name: str, endpoint: str, request_id: str = None):
         """Log the start of an external service call."""
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        
         if not request_id:
             request_id = request_id_var.get('')
         
         self.logger.info(
-            f"External service call started - {service_name}",
+            "External service call started - %s", service_name,
             extra={
                 "request_id": request_id,
                 "service_name": service_name,
@@ -175,12 +245,15 @@ class ServiceLogger:
     
     def log_service_call_end(self, service_name: str, endpoint: str, response_time_ms: float, success: bool = True, request_id: str = None):
         """Log the completion of an external service call."""
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        
         if not request_id:
             request_id = request_id_var.get('')
         
         status = "success" if success else "failure"
         self.logger.info(
-            f"External service call completed - {service_name} ({status}), Time: {response_time_ms:.1f}ms",
+            "External service call completed - %s (%s), Time: %.1fms", service_name, status, response_time_ms,
             extra={
                 "request_id": request_id,
                 "service_name": service_name,
@@ -193,11 +266,14 @@ class ServiceLogger:
     
     def log_service_error(self, service_name: str, endpoint: str, error: Exception, response_time_ms: float = None, request_id: str = None):
         """Log external service errors with context."""
+        if not self.logger.isEnabledFor(logging.ERROR):
+            return
+        
         if not request_id:
             request_id = request_id_var.get('')
         
         self.logger.error(
-            f"External service call failed - {service_name}: {str(error)}",
+            "External service call failed - %s: %s", service_name, error,
             extra={
                 "request_id": request_id,
                 "service_name": service_name,
@@ -216,51 +292,89 @@ class MetricsCollector:
     
     def __init__(self):
         self.logger = logging.getLogger("firstaidvox.metrics")
+        # Counters are updated from the event loop and the threadpool alike
+        self._lock = threading.Lock()
         self._request_count = 0
         self._error_count = 0
         self._total_response_time = 0.0
-        self._service_call_count = {}
-        self._service_error_count = {}
+        self._service_call_count = Counter()
+        self._service_error_count = Counter()
+        # Bumped on every update so unchanged metrics can be served from _snapshot
+        self._version = 0
+        self._snapshot: Optional[Tuple[int, Dict[str, Any]]] = None
     
     def increment_request_count(self):
         """Increment total request count."""
-        self._request_count += 1
+        with self._lock:
+            self._request_count += 1
+            self._version += 1
     
     def increment_error_count(self):
         """Increment total error count."""
-        self._error_count += 1
+        with self._lock:
+            self._error_count += 1
+            self._version += 1
     
     def record_response_time(self, response_time_ms: float):
         """Record response time for averaging."""
-        self._total_response_time += response_time_ms
+        with self._lock:
+            self._total_response_time += response_time_ms
+            self._version += 1
     
     def increment_service_call(self, service_name: str):
         """Increment service call count for a specific service."""
-        self._service_call_count[service_name] = self._service_call_count.get(service_name, 0) + 1
+        with self._lock:
+            self._service_call_count[service_name] += 1
+            self._version += 1
     
     def increment_service_error(self, service_name: str):
         """Increment service error count for a specific service."""
-        self._service_error_count[service_name] = self._service_error_count.get(service_name, 0) + 1
+        with self._lock:
+            self._service_error_count[service_name] += 1
+            self._version += 1
     
     def get_metrics(self) -> Dict[str, Any]:
-        """Get current metrics for monitoring."""
-        avg_response_time = 0.0
-        if self._request_count > 0:
-            avg_response_time = self._total_response_time / self._request_count
+        """
+        Get current metrics for monitoring.
         
-        error_rate = 0.0
-        if self._request_count > 0:
-            error_rate = (self._error_count / self._request_count) * 100
+        The nested service dicts are shared between calls while no metric
+        changes, so callers must treat them as read-only.
+        """
+        snapshot = self._snapshot
         
-        return {
-            "request_count": self._request_count,
-            "error_count": self._error_count,
-            "error_rate_percent": round(error_rate, 2),
-            "average_response_time_ms": round(avg_response_time, 2),
-            "service_calls": self._service_call_count.copy(),
-            "service_errors": self._service_error_count.copy(),
-            "timestamp": datetime.utcnow().isoformat() + "Z"
-        }
+        # Take a consistent snapshot so averages and rates agree with the counts
+        with self._lock:
+            version = self._version
+            if snapshot is None or snapshot[0] != version:
+                request_count = self._request_count
+                error_count = self._error_count
+                total_response_time = self._total_response_time
+                service_calls = dict(self._service_call_count)
+                service_errors = dict(self._service_error_count)
+                snapshot = None
+        
+        if snapshot is None:
+            avg_response_time = 0.0
+            if request_count > 0:
+                avg_response_time = total_response_time / request_count
+            
+            error_rate = 0.0
+            if request_count > 0:
+                error_rate = (error_count / request_count) * 100
+            
+            snapshot = (version, {
+                "request_count": request_count,
+                "error_count": error_count,
+                "error_rate_percent": round(error_rate, 2),
+                "average_response_time_ms": round(avg_response_time, 2),
+                "service_calls": service_calls,
+                "service_errors": service_errors,
+            })
+            self._snapshot = snapshot
+        
+        metrics = dict(snapshot[1])
+        metrics["timestamp"] = datetime.utcnow().isoformat() + "Z"
+        return metrics
     
     def log_metrics(self):
         """Log current metrics for monitoring systems."""
@@ -276,41 +390,58 @@ class MetricsCollector:
 
 # Global instances
 _metrics_collector = None
-_request_logger = None
-_service_logger = None
+_metrics_collector_lock = threading.Lock()
 
 
 def get_metrics_collector() -> MetricsCollector:
     """Get the global metrics collector instance."""
     global _metrics_collector
     if _metrics_collector is None:
-        _metrics_collector = MetricsCollector()
+        with _metrics_collector_lock:
+            if _metrics_collector is None:
+                _metrics_collector = MetricsCollector()
     return _metrics_collector
 
 
+@lru_cache(maxsize=1)
 def get_request_logger() -> RequestLogger:
     """Get the global request logger instance."""
-    global _request_logger
-    if _request_logger is None:
-        _request_logger = RequestLogger()
-    return _request_logger
+    return RequestLogger()
 
 
+@lru_cache(maxsize=1)
 def get_service_logger() -> ServiceLogger:
     """Get the global service logger instance."""
-    global _service_logger
-    if _service_logger is None:
-        _service_logger = ServiceLogger()
-    return _service_logger
+    return ServiceLogger()
+
+
+@dataclass(frozen=True)
+class LoggingContext:
+    """Request logger, service logger and metrics collector resolved together."""
+    
+    request: RequestLogger
+    service: ServiceLogger
+    metrics: MetricsCollector
+
+
+@lru_cache(maxsize=1)
+def get_logging_context() -> LoggingContext:
+    """Get the shared logging context for hot paths that need several utilities."""
+    return LoggingContext(
+        request=get_request_logger(),
+        service=get_service_logger(),
+        metrics=get_metrics_collector(),
+    )
 
 
 def get_logging_config() -> Dict[str, Any]:
     """Get logging configuration based on environment settings."""
     
     settings = get_settings()
+    is_production = settings.environment == "production"
     
     # Use structured JSON logging for production, simple format for development
-    if settings.environment == "production":
+    if is_production:
         formatter_class = "config.logging.StructuredFormatter"
         format_string = None
         log_level = "INFO"  # Force INFO level in production for Google Cloud Logging
@@ -330,7 +461,7 @@ def get_logging_config() -> Dict[str, Any]:
     }
     
     # Add file handler for production environments
-    if settings.environment == "production":
+    if is_production:
         handlers["file"] = {
             "class": "logging.handlers.RotatingFileHandler",
             "formatter": "default",
@@ -395,10 +526,68 @@ def get_logging_config() -> Dict[str, Any]:
     return config
 
 
+class _LogQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that defers all formatting to the handler behind the queue."""
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Merge args now so the record no longer references mutable caller state,
+        # but keep exc_info so the real handler's formatter still renders it.
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+# Background listeners draining the queued log records
+_queue_listeners: List[logging.handlers.QueueListener] = []
+
+
+def _stop_queue_listeners() -> None:
+    """Flush and stop all background log listeners."""
+    while _queue_listeners:
+        _queue_listeners.pop().stop()
+
+
+atexit.register(_stop_queue_listeners)
+
+
+def _enable_queue_logging(logger_names: List[str]) -> None:
+    """
+    Move configured handlers behind queues so logging calls never block on I/O.
+    
+    Each handler gets its own queue and listener thread, so loggers keep
+    writing to exactly the handlers they were configured with.
+    """
+    queue_handlers = {}
+    for name in [None] + logger_names:
+        logger = logging.getLogger(name)
+        for index, handler in enumerate(logger.handlers):
+            if isinstance(handler, logging.handlers.QueueHandler):
+                continue
+            if handler not in queue_handlers:
+                log_queue = queue.Queue(-1)
+                listener = logging.handlers.QueueListener(
+                    log_queue, handler, respect_handler_level=True
+                )
+                listener.start()
+                _queue_listeners.append(listener)
+                queue_handlers[handler] = _LogQueueHandler(log_queue)
+            logger.handlers[index] = queue_handlers[handler]
+
+
 def setup_logging() -> None:
     """Configure logging for the application."""
     config = get_logging_config()
+    # Drain any previous listeners before dictConfig closes their handlers
+    _stop_queue_listeners()
     logging.config.dictConfig(config)
+    _enable_queue_logging(list(config["loggers"]))
+    
+    # Neither log format emits thread or process details, so skip collecting
+    # them for every LogRecord
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
     
     # Create application logger
     logger = logging.getLogger("firstaidvox")
@@ -3,10 +3,17 @@ Configuration settings for FirstAidVox Backend.
 Handles environment variables and application configuration.
 """
 
+import json
 import os
-from typing import List, Optional
+import re
+from functools import lru_cache
+from typing import Annotated, List, Optional
 from pydantic import Field, field_validator
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, NoDecode, SettingsConfigDict
+
+
+# Separator for comma-separated list values such as CORS_ORIGINS
+_LIST_SEPARATOR = re.compile(r"\s*,\s*")
 
 
 class Settings(BaseSettings):
@@ -38,7 +45,8 @@ class Settings(BaseSettings):
     debug: bool = Field(default=False, env="DEBUG")
     
     # API Configuration
-    cors_origins: List[str] = Field(
+    # NoDecode hands the raw env string to parse_cors_origins instead of requiring JSON
+    cors_origins: Annotated[List[str], NoDecode] = Field(
         default=["http://localhost:3000", "http://localhost:5173", "http://localhost:8080"],
         env="CORS_ORIGINS"
     )
@@ -46,10 +54,13 @@ class Settings(BaseSettings):
     @field_validator("cors_origins", mode="before")
     @classmethod
     def parse_cors_origins(cls, v):
-        """Parse CORS origins from string or list."""
+        """Parse CORS origins from a JSON array, comma-separated string, or list."""
         if isinstance(v, str):
+            v = v.strip()
+            if v.startswith("["):
+                return json.loads(v)
             # Handle comma-separated string
-            return [origin.strip() for origin in v.split(',') if origin.strip()]
+            return [origin for origin in _LIST_SEPARATOR.split(v) if origin]
         elif isinstance(v, list):
             return v
         return ["http://localhost:3000", "http://localhost:8080"]
@@ -96,19 +107,16 @@ class Settings(BaseSettings):
             raise ValueError("Response time limit must be between 1 and 10 seconds")
         return v
     
-    class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
-        case_sensitive = False
-
-
-# Global settings instance - will be initialized when needed
-settings = None
+    # Settings are loaded once per process and shared, so reject mutation
+    model_config = SettingsConfigDict(
+        frozen=True,
+        env_file=".env",
+        env_file_encoding="utf-8",
+        case_sensitive=False,
+    )
 
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    """Get the global settings instance, creating it if needed."""
-    global settings
-    if settings is None:
-        settings = Settings()
-    return settings
\ No newline at end of file
+    """Get the global settings instance, creating it on first use."""
+    return Settings()
\ No newline at end of file
@@ -0,0 +1,24 @@
+"""
+Shared search client for the RAG and search debug scripts
+"""
+
+from functools import lru_cache
+from app.services.search_service import VertexSearchClient
+
+
+@lru_cache(maxsize=1)
+def shared_search_client() -> VertexSearchClient:
+    """Return the process-wide search client (not yet initialized)."""
+    return VertexSearchClient()
+
+
+async def get_search_client() -> VertexSearchClient:
+    """Return the shared search client, initializing it on first use.
+    
+    Callers that share the client across concurrent tasks should await this
+    once before starting them, as test_rag.main does.
+    """
+    search_client = shared_search_client()
+    if not search_client.is_initialized:
+        await search_client.initialize()
+    return search_client
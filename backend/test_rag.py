@@ -5,16 +5,21 @@ Simple test script for RAG functionality
 
 import asyncio
 import os
+import traceback
+from typing import Optional
 from app.services.search_service import VertexSearchClient
+from search_client import get_search_client
+from test_search_debug import test_search_debug
 
-async def test_search():
+
+async def test_search(search_client: Optional[VertexSearchClient] = None):
     """Test the Vertex AI Search functionality"""
     try:
         print("🔍 Testing Vertex AI Search...")
         
-        # Initialize search client
-        search_client = VertexSearchClient()
-        await search_client.initialize()
+        # Initialize search client unless an initialized one was passed in
+        if search_client is None:
+            search_client = await get_search_client()
         
         print("✅ Search client initialized successfully")
         
@@ -22,20 +27,22 @@ async def test_search():
         query = "fever and headache symptoms"
         print(f"🔎 Searching for: '{query}'")
         
-        results = await search_client.search_medical_documents(
+        # Print each result as it is yielded
+        results = []
+        async for result in search_client.search_medical_documents_stream(
             query=query,
             max_results=3,
             include_snippets=True
-        )
-        
-        print(f"📄 Found {len(results)} results:")
-        for i, result in enumerate(results, 1):
-            print(f"\n--- Result {i} ---")
+        ):
+            results.append(result)
+            print(f"\n--- Result {len(results)} ---")
             print(f"Title: {result.get('title', 'N/A')}")
             print(f"Content: {result.get('content', 'N/A')[:200]}...")
             print(f"Snippet: {result.get('snippet', 'N/A')}")
             print(f"Score: {result.get('relevance_score', 'N/A')}")
         
+        print(f"\n📄 Found {len(results)} results")
+        
         # Test context formatting
         context = search_client.format_search_results_for_context(results)
         print(f"\n📝 Formatted context:\n{context[:500]}...")
@@ -44,8 +51,16 @@ async def test_search():
         
     except Exception as e:
         print(f"❌ Error during RAG test: {e}")
-        import traceback
         traceback.print_exc()
 
+
+async def main():
+    """Run the RAG and debug search checks concurrently on one initialized client."""
+    search_client = await get_search_client()
+    await asyncio.gather(
+        test_search(search_client),
+        test_search_debug(search_client)
+    )
+
 if __name__ == "__main__":
-    asyncio.run(test_search())
\ No newline at end of file
+    asyncio.run(main())
\ No newline at end of file
@@ -5,24 +5,29 @@ Debug test for search service
 
 import logging
 import asyncio
+from typing import Optional
 from app.services.search_service import VertexSearchClient
+from search_client import shared_search_client, get_search_client
 
 # Set up logging
 logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
-async def test_search_debug():
+async def test_search_debug(search_client: Optional[VertexSearchClient] = None):
     """Debug test for search service"""
     
     print("🔍 Debug testing Vertex AI Search...\n")
     
     try:
-        search_client = VertexSearchClient()
+        initialized = search_client is not None
+        if not initialized:
+            search_client = shared_search_client()
         print(f"Created client with PROJECT_ID: {search_client.PROJECT_ID}")
         print(f"LOCATION: {search_client.LOCATION}")
-        print(f"DATA_STORE_ID: {search_client.DATA_STORE_ID}")
+        print(f"ENGINE_ID: {search_client.ENGINE_ID}")
         
-        await search_client.initialize()
+        if not initialized:
+            await get_search_client()
         
     except Exception as e:
         print(f"❌ Error: {e}")
@@ -13,6 +13,10 @@ def test_settings():
     try:
         settings = get_settings()
         
+        # get_settings is cached, so every caller shares one instance
+        assert get_settings() is settings, "get_settings() should return a cached instance"
+        print("✅ Settings instance is cached")
+        
         print(f"Google Cloud Project ID: {settings.google_cloud_project_id}")
         print(f"Google Cloud Location: {settings.google_cloud_location}")
         print(f"Data Store ID: {settings.data_store_id}")
@@ -0,0 +1,101 @@
+"""Shared pytest fixtures for the FirstAidVox backend tests."""
+
+import os
+
+import hypothesis
+import pytest
+from hypothesis import Phase, settings
+from hypothesis.database import DirectoryBasedExampleDatabase
+from unittest.mock import Mock, patch, AsyncMock
+
+
+# Hypothesis profiles: "ci-fast" (default) keeps the smoke-level properties
+# cheap; "fast" runs only the explicit @example inputs for quick local
+# iteration; select "thorough" with HYPOTHESIS_PROFILE=thorough for nightly runs.
+# The per-test budgets in the API and model property modules apply only under
+# ci-fast; the other profiles' max_examples govern every module.
+# All profiles share one example database so CI can cache .hypothesis/examples
+# between runs and replay previously interesting inputs in the reuse phase.
+# Under pytest-xdist (pytest -n auto) each worker gets its own directory so
+# workers never contend for the same database files.
+_XDIST_WORKER = os.environ.get("PYTEST_XDIST_WORKER")
+_EXAMPLE_DB = DirectoryBasedExampleDatabase(
+    f".hypothesis/examples-{_XDIST_WORKER}" if _XDIST_WORKER else ".hypothesis/examples"
+)
+settings.register_profile(
+    "ci-fast",
+    max_examples=25,
+    deadline=None,
+    database=_EXAMPLE_DB,
+    phases=[Phase.explicit, Phase.reuse, Phase.generate],
+)
+# ci-fast variant for the model properties: Hypothesis 6.100+ generates nested
+# one_of/dictionaries strategies noticeably slower, so the budget drops there
+settings.register_profile(
+    "ci-fast-models",
+    settings.get_profile("ci-fast"),
+    max_examples=10 if hypothesis.__version_info__ >= (6, 100) else 25,
+)
+settings.register_profile("fast", deadline=None, database=_EXAMPLE_DB, phases=[Phase.explicit])
+settings.register_profile("thorough", max_examples=200, deadline=None, database=_EXAMPLE_DB)
+# Loaded profile name; property modules import it to pick their per-test budgets
+HYPOTHESIS_PROFILE_NAME = os.getenv("HYPOTHESIS_PROFILE", "ci-fast")
+settings.load_profile(HYPOTHESIS_PROFILE_NAME)
+
+
+@pytest.fixture(scope="session")
+def mock_settings():
+    """Mock settings shared by the API test modules."""
+    mock_settings = Mock()
+    mock_settings.cors_origins = ["http://localhost:3000", "http://localhost:8080"]
+    mock_settings.debug = True
+    mock_settings.environment = "test"
+    return mock_settings
+
+
+@pytest.fixture(scope="session")
+def mock_service_manager():
+    """Mock service manager shared by the API test modules."""
+    mock_sm = Mock()
+    mock_sm.initialize_all = AsyncMock()
+    mock_sm.cleanup = AsyncMock()
+    mock_sm.get_health_status.return_value = {
+        "initialized": True,
+        "services": {
+            "vertex_ai": {"connected": True, "service": "Google Cloud Vertex AI", "model": "gemini-1.5-flash-001"},
+            "google_maps": {"connected": True, "service": "Google Maps Places API", "features": ["hospital_search", "pharmacy_search"]}
+        },
+        "all_services_healthy": True
+    }
+    return mock_sm
+
+
+@pytest.fixture(scope="session")
+def mock_handler():
+    """Mock multimodal handler shared by the API test modules.
+
+    process_request is created once; tests set its return_value or side_effect.
+    """
+    handler = Mock()
+    handler.process_request = AsyncMock()
+    return handler
+
+
+@pytest.fixture(scope="session")
+def test_app(mock_settings, mock_service_manager, mock_handler):
+    """Create the app once per session with properly mocked dependencies.
+
+    Modules that need different app wiring define their own test_app fixture.
+    """
+    with patch('config.settings.get_settings', return_value=mock_settings), \
+         patch('app.main.get_service_manager', return_value=mock_service_manager), \
+         patch('app.main.MultimodalHandler', return_value=mock_handler):
+        
+        from app.main import create_app
+        app = create_app()
+        
+        # Manually set the app state since lifespan isn't called in tests
+        app.state.service_manager = mock_service_manager
+        app.state.multimodal_handler = mock_handler
+        
+        return app
@@ -12,67 +12,125 @@
 
 import pytest
 import asyncio
-from unittest.mock import Mock, patch, AsyncMock
 from hypothesis import given, strategies as st, settings
 from hypothesis import HealthCheck
 from fastapi.testclient import TestClient
-from fastapi import UploadFile
+from fastapi import HTTPException, UploadFile
 import io
-import json
+import orjson
 
 from app.models.chat import ChatResponse
 from app.models.error import ErrorResponse
 from app.models.hospital import HospitalResult
+from tests.conftest import HYPOTHESIS_PROFILE_NAME
 
 
-@pytest.fixture
-def mock_settings():
-    """Mock settings for all tests."""
-    mock_settings = Mock()
-    mock_settings.cors_origins = ["http://localhost:3000", "http://localhost:8080"]
-    mock_settings.debug = True
-    mock_settings.environment = "test"
-    return mock_settings
+# Shared settings for the property tests in this module. Examples are
+# independent, so the module can also be run in parallel with pytest-xdist
+# (-n auto --dist=loadfile); the reuse phase replays saved failures first from
+# the worker-local example database configured in conftest.py.
+# Structural format/CORS invariants need few examples; error paths get more.
+# Phases are inherited from the active profile, so HYPOTHESIS_PROFILE=fast
+# stays explicit-only.
+def _budget(max_examples):
+    """Per-test example budget under ci-fast; other profiles keep their own."""
+    if HYPOTHESIS_PROFILE_NAME == "ci-fast":
+        return max_examples
+    return settings.default.max_examples
 
 
-@pytest.fixture
-def mock_service_manager():
-    """Mock service manager for all tests."""
-    mock_sm = Mock()
-    mock_sm.initialize_all = AsyncMock()
-    mock_sm.cleanup = AsyncMock()
-    mock_sm.get_health_status.return_value = {
-        "initialized": True,
-        "services": {
-            "vertex_ai": {"connected": True, "service": "Google Cloud Vertex AI", "model": "gemini-1.5-flash-001"},
-            "google_maps": {"connected": True, "service": "Google Maps Places API", "features": ["hospital_search", "pharmacy_search"]}
-        },
-        "all_services_healthy": True
-    }
-    return mock_sm
+FAST_SETTINGS = settings(
+    max_examples=_budget(30),
+    deadline=None,
+    suppress_health_check=[HealthCheck.too_slow],
+)
+EDGE_SETTINGS = settings(FAST_SETTINGS, max_examples=_budget(100))
 
+# Low-cardinality axes are parametrized; each case gets a share of the budget
+# so the total example count stays close to the unparametrized tests.
+_CONFIDENCE_LEVELS = ["high", "medium", "low"]
+_ERROR_STATUS_CODES = [400, 401, 403, 404, 413, 422, 500, 503]
+FAST_PER_CASE_SETTINGS = settings(FAST_SETTINGS, max_examples=_budget(10))
+EDGE_PER_CASE_SETTINGS = settings(EDGE_SETTINGS, max_examples=_budget(15))
 
-@pytest.fixture
-def mock_handler():
-    """Mock multimodal handler for all tests."""
-    return Mock()
+# Fields every successful chat response must contain
+_CHAT_RESPONSE_FIELDS = frozenset({"advice", "hospitals", "confidence_level", "timestamp"})
 
+# CORS headers every response must carry; only headers are checked, never the body
+_CORS_HEADERS = ("access-control-allow-origin", "access-control-allow-credentials")
 
-@pytest.fixture
-def test_app(mock_settings, mock_service_manager, mock_handler):
-    """Create a test app with properly mocked dependencies."""
-    with patch('config.settings.get_settings', return_value=mock_settings), \
-         patch('app.main.get_service_manager', return_value=mock_service_manager), \
-         patch('app.main.MultimodalHandler', return_value=mock_handler):
-        
-        from app.main import create_app
-        app = create_app()
-        
-        # Manually set the app state since lifespan isn't called in tests
-        app.state.service_manager = mock_service_manager
-        app.state.multimodal_handler = mock_handler
-        
-        return app
+# Fixed text pools covering short, padded, non-ASCII and maximum-length inputs.
+# The chat and CORS properties only check that text passes through, so sampling
+# from these avoids generating and filter-rejecting random unicode per example.
+_SHORT_TEXTS = [
+    "x",
+    "hi",
+    "fever",
+    "chest pain",
+    "  headache  ",
+    "I cut my finger while cooking",
+    "My child has a high fever and a rash",
+    "Someone fainted and is breathing slowly",
+    "burn on hand\nblistering",
+    "Tengo dolor de cabeza",
+    "머리가 아파요",
+    "頭が痛いです",
+    "allergic reaction 🐝",
+    "What should I do about a sprained ankle?",
+    "\tnosebleed that won't stop",
+    "a" * 100,
+    "pain " * 60,
+    "x" * 499,
+    "y" * 500,
+]
+
+_ADVICE_TEXTS = [
+    "Take rest.",
+    "Apply a cold compress for 15 minutes.",
+    "Call emergency services immediately.",
+    "  Keep the wound clean and covered.  ",
+    "Drink plenty of fluids and monitor the fever.",
+    "Press firmly on the wound to stop the bleeding.\nSeek care if it continues.",
+    "충분히 휴식을 취하세요.",
+    "安静にして様子を見てください。",
+    "Descanse y beba mucha agua.",
+    "Elevate the injured limb 🦵 and apply ice.",
+    "Do not move the person if you suspect a spinal injury.",
+    "advice " * 50,
+    "x" * 999,
+    "z" * 1000,
+]
+
+# Mock hospital lists indexed by length, built once instead of per example
+_HOSPITAL_LISTS = [
+    [
+        HospitalResult(
+            name=f"Hospital {i+1}",
+            address=f"{i+1}00 Hospital St",
+            distance_km=float(i + 1),
+            place_id=f"place_id_{i+1}",
+            rating=4.0 + (i * 0.1) if i % 2 == 0 else None
+        )
+        for i in range(n)
+    ]
+    for n in range(6)
+]
+_EXPECTED_HOSPITAL_DICTS = [
+    [hospital.model_dump(mode="json") for hospital in hospital_list]
+    for hospital_list in _HOSPITAL_LISTS
+]
+
+
+@pytest.fixture(scope="module")
+def client(test_app):
+    """Share one test client across all examples in this module.
+
+    The client is not entered as a context manager: the lifespan would try to
+    initialize the real Google Cloud clients, and app state is set by test_app.
+    """
+    test_client = TestClient(test_app)
+    yield test_client
+    test_client.close()
 
 
 class TestAPIResponseFormatProperty:
@@ -82,31 +140,22 @@ class TestAPIResponseFormatProperty:
     **Validates: Requirements 4.3**
     """
 
+    @pytest.mark.parametrize("confidence_level", _CONFIDENCE_LEVELS)
     @given(
-        text=st.text(min_size=1, max_size=500).filter(lambda x: x.strip()),
-        advice_text=st.text(min_size=10, max_size=1000).filter(lambda x: x.strip()),
-        confidence_level=st.sampled_from(["high", "medium", "low"]),
+        text=st.sampled_from(_SHORT_TEXTS),
+        advice_text=st.sampled_from(_ADVICE_TEXTS),
         has_hospitals=st.booleans(),
         num_hospitals=st.integers(min_value=0, max_value=5)
     )
-    @settings(suppress_health_check=[HealthCheck.function_scoped_fixture])
+    @FAST_PER_CASE_SETTINGS
     def test_successful_chat_response_format_consistency(
         self, text: str, advice_text: str, confidence_level: str, 
-        has_hospitals: bool, num_hospitals: int, test_app, mock_handler
+        has_hospitals: bool, num_hospitals: int, client, mock_handler
     ):
         """For any successful chat request, the response should contain AI advice text and optional hospital data in the specified JSON structure."""
         
-        # Generate mock hospital data if needed
-        hospitals = []
-        if has_hospitals and num_hospitals > 0:
-            for i in range(num_hospitals):
-                hospitals.append(HospitalResult(
-                    name=f"Hospital {i+1}",
-                    address=f"{i+1}00 Hospital St",
-                    distance_km=float(i + 1),
-                    place_id=f"place_id_{i+1}",
-                    rating=4.0 + (i * 0.1) if i % 2 == 0 else None
-                ))
+        # Mock hospital data only depends on num_hospitals, so reuse the precomputed lists
+        hospitals = _HOSPITAL_LISTS[num_hospitals] if has_hospitals else []
         
         # Mock successful response from handler
         mock_response = ChatResponse(
@@ -114,10 +163,8 @@ class TestAPIResponseFormatProperty:
             hospitals=hospitals if hospitals else None,
             confidence_level=confidence_level
         )
-        mock_handler.process_request = AsyncMock(return_value=mock_response)
-        
-        # Create test client
-        client = TestClient(test_app)
+        mock_handler.process_request.side_effect = None
+        mock_handler.process_request.return_value = mock_response
         
         # Make request
         response = client.post(
@@ -129,53 +176,25 @@ class TestAPIResponseFormatProperty:
         assert response.status_code == 200
         
         # Verify response format
-        response_data = response.json()
-        
-        # Verify all required fields are present
-        required_fields = ["advice", "hospitals", "confidence_level", "timestamp"]
-        for field in required_fields:
-            assert field in response_data, f"Missing required field: {field}"
-        
-        # Verify field types and values
-        assert isinstance(response_data["advice"], str)
-        assert len(response_data["advice"]) > 0
-        assert response_data["advice"] == advice_text
-        
-        assert response_data["confidence_level"] in ["high", "medium", "low"]
-        assert response_data["confidence_level"] == confidence_level
+        response_data = orjson.loads(response.content)
         
+        # Stage 1: cheap shape check that all required fields are present
+        assert _CHAT_RESPONSE_FIELDS <= response_data.keys(), (
+            f"Missing required fields: {_CHAT_RESPONSE_FIELDS - response_data.keys()}"
+        )
         assert isinstance(response_data["timestamp"], str)
         
-        # Verify hospital data structure
-        if has_hospitals and num_hospitals > 0:
-            assert response_data["hospitals"] is not None
-            assert isinstance(response_data["hospitals"], list)
-            assert len(response_data["hospitals"]) == num_hospitals
-            
-            for i, hospital in enumerate(response_data["hospitals"]):
-                # Verify hospital structure
-                hospital_fields = ["name", "address", "distance_km", "place_id", "rating"]
-                for field in hospital_fields:
-                    assert field in hospital, f"Missing hospital field: {field}"
-                
-                # Verify hospital field types
-                assert isinstance(hospital["name"], str)
-                assert isinstance(hospital["address"], str)
-                assert isinstance(hospital["distance_km"], (int, float))
-                assert isinstance(hospital["place_id"], str)
-                assert hospital["rating"] is None or isinstance(hospital["rating"], (int, float))
-                
-                # Verify hospital field values
-                assert hospital["name"] == f"Hospital {i+1}"
-                assert hospital["address"] == f"{i+1}00 Hospital St"
-                assert hospital["distance_km"] == float(i + 1)
-                assert hospital["place_id"] == f"place_id_{i+1}"
-        else:
-            assert response_data["hospitals"] is None
+        # Stage 2: one deep comparison of the content fields
+        expected = {
+            "advice": advice_text,
+            "hospitals": _EXPECTED_HOSPITAL_DICTS[num_hospitals] if has_hospitals and num_hospitals else None,
+            "confidence_level": confidence_level,
+        }
+        assert {key: response_data[key] for key in expected} == expected
         
         # Verify response can be parsed as valid JSON
-        json_str = json.dumps(response_data)
-        parsed_back = json.loads(json_str)
+        json_bytes = orjson.dumps(response_data)
+        parsed_back = orjson.loads(json_bytes)
         assert parsed_back == response_data
 
 
@@ -187,15 +206,15 @@ class TestCORSHeaderProperty:
     """
 
     @given(
-        text=st.text(min_size=1, max_size=500).filter(lambda x: x.strip()),
+        text=st.sampled_from(_SHORT_TEXTS),
         origin=st.sampled_from([
             "http://localhost:3000",
             "http://localhost:8080"
         ])
     )
-    @settings(suppress_health_check=[HealthCheck.function_scoped_fixture])
+    @FAST_SETTINGS
     def test_cors_headers_included_in_chat_responses(
-        self, text: str, origin: str, test_app, mock_handler
+        self, text: str, origin: str, client, mock_handler
     ):
         """For any API endpoint response, CORS headers should be included to support web client applications."""
         
@@ -205,10 +224,8 @@ class TestCORSHeaderProperty:
             hospitals=None,
             confidence_level="high"
         )
-        mock_handler.process_request = AsyncMock(return_value=mock_response)
-        
-        # Create test client
-        client = TestClient(test_app)
+        mock_handler.process_request.side_effect = None
+        mock_handler.process_request.return_value = mock_response
         
         # Make request with Origin header
         response = client.post(
@@ -221,12 +238,7 @@ class TestCORSHeaderProperty:
         assert response.status_code == 200
         
         # Verify CORS headers are present
-        cors_headers = [
-            "access-control-allow-origin",
-            "access-control-allow-credentials"
-        ]
-        
-        for header in cors_headers:
+        for header in _CORS_HEADERS:
             assert header in response.headers, f"Missing CORS header: {header}"
         
         # Verify CORS header values
@@ -243,15 +255,12 @@ class TestCORSHeaderProperty:
             "http://localhost:8080"
         ])
     )
-    @settings(suppress_health_check=[HealthCheck.function_scoped_fixture])
+    @FAST_SETTINGS
     def test_cors_headers_included_in_health_responses(
-        self, method: str, origin: str, test_app
+        self, method: str, origin: str, client
     ):
         """For any health endpoint response, CORS headers should be included."""
         
-        # Create test client
-        client = TestClient(test_app)
-        
         # Make request to health endpoint
         if method == "GET":
             response = client.get("/health", headers={"Origin": origin})
@@ -259,12 +268,7 @@ class TestCORSHeaderProperty:
             response = client.options("/health", headers={"Origin": origin})
         
         # Verify CORS headers are present regardless of method or response status
-        cors_headers = [
-            "access-control-allow-origin",
-            "access-control-allow-credentials"
-        ]
-        
-        for header in cors_headers:
+        for header in _CORS_HEADERS:
             assert header in response.headers, f"Missing CORS header: {header} for method {method}"
 
 
@@ -283,28 +287,22 @@ class TestErrorHandlingConsistencyProperty:
         ),
         error_code=st.sampled_from(["EMPTY_TEXT", "TEXT_TOO_LONG", "INVALID_TEXT"])
     )
-    @settings(suppress_health_check=[HealthCheck.function_scoped_fixture])
+    @EDGE_SETTINGS
     def test_input_validation_error_format_consistency(
-        self, invalid_text: str, error_code: str, test_app, mock_handler
+        self, invalid_text: str, error_code: str, client, mock_handler
     ):
         """For any invalid input or system error, the system should return a JSON error response with appropriate HTTP status codes and clear error messages."""
         
         # Mock validation error from handler
-        from fastapi import HTTPException
-        mock_handler.process_request = AsyncMock(
-            side_effect=HTTPException(
-                status_code=400,
-                detail={
-                    "code": error_code,
-                    "message": "Input validation failed",
-                    "details": {"field": "text"}
-                }
-            )
+        mock_handler.process_request.side_effect = HTTPException(
+            status_code=400,
+            detail={
+                "code": error_code,
+                "message": "Input validation failed",
+                "details": {"field": "text"}
+            }
         )
         
-        # Create test client
-        client = TestClient(test_app)
-        
         # Make request with invalid input
         response = client.post(
             "/chat",
@@ -315,7 +313,7 @@ class TestErrorHandlingConsistencyProperty:
         assert response.status_code == 400
         
         # Verify error response format
-        error_data = response.json()
+        error_data = orjson.loads(response.content)
         
         # Verify required error fields
         required_fields = ["error", "timestamp", "request_id"]
@@ -342,32 +340,26 @@ class TestErrorHandlingConsistencyProperty:
         assert isinstance(error_data["request_id"], str)
         assert len(error_data["request_id"]) > 0
 
+    @pytest.mark.parametrize("status_code", _ERROR_STATUS_CODES)
     @given(
-        status_code=st.sampled_from([400, 401, 403, 404, 413, 422, 500, 503]),
         error_message=st.text(min_size=1, max_size=200).filter(lambda x: x.strip())
     )
-    @settings(suppress_health_check=[HealthCheck.function_scoped_fixture])
+    @EDGE_PER_CASE_SETTINGS
     def test_various_error_status_codes_format_consistency(
-        self, status_code: int, error_message: str, test_app, mock_handler
+        self, status_code: int, error_message: str, client, mock_handler
     ):
         """For any error status code, the error response format should be consistent."""
         
         # Mock different types of errors
-        from fastapi import HTTPException
-        mock_handler.process_request = AsyncMock(
-            side_effect=HTTPException(
-                status_code=status_code,
-                detail={
-                    "code": f"ERROR_{status_code}",
-                    "message": error_message,
-                    "details": {}
-                }
-            )
+        mock_handler.process_request.side_effect = HTTPException(
+            status_code=status_code,
+            detail={
+                "code": f"ERROR_{status_code}",
+                "message": error_message,
+                "details": {}
+            }
         )
         
-        # Create test client
-        client = TestClient(test_app)
-        
         # Make request that triggers error
         response = client.post(
             "/chat",
@@ -378,7 +370,7 @@ class TestErrorHandlingConsistencyProperty:
         assert response.status_code == status_code
         
         # Verify consistent error format regardless of status code
-        error_data = response.json()
+        error_data = orjson.loads(response.content)
         
         # Verify standard error structure
         required_fields = ["error", "timestamp", "request_id"]
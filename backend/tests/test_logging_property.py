@@ -12,17 +12,91 @@ import asyncio
 import time
 import logging
 import json
+import re
+import httpx
 from unittest.mock import Mock, patch, AsyncMock, MagicMock
 from hypothesis import given, strategies as st, settings
 from hypothesis import HealthCheck
+from fastapi import HTTPException
 from fastapi.testclient import TestClient
-from io import StringIO
+from operator import itemgetter
+from types import MappingProxyType, SimpleNamespace
 
 from app.models.chat import ChatResponse
+from app.models.hospital import HospitalResult
 from config.logging import get_logger, StructuredFormatter
 
 
-@pytest.fixture
+# Health status reported by the mock service manager
+_HEALTH_STATUS = MappingProxyType({
+    "initialized": True,
+    "services": {
+        "vertex_ai": {"connected": True, "service": "Google Cloud Vertex AI", "model": "gemini-1.5-flash-001"},
+        "google_maps": {"connected": True, "service": "Google Maps Places API", "features": ["hospital_search", "pharmacy_search"]}
+    },
+    "all_services_healthy": True
+})
+
+# X-Response-Time is emitted as "%.3fs"; these match it below a bound without float()
+_UNDER_10S = re.compile(r"\d\.\d{3}s")
+_UNDER_4S = re.compile(r"[0-3]\.\d{3}s")
+_UNDER_1S = re.compile(r"0\.\d{3}s")
+
+# Simulated service delays are drawn up to 2.5 s and never slept, so the
+# measured time is the app's own overhead, which must fit the rest of the 3 s budget
+_OVERHEAD_LIMIT_SECONDS = 0.5
+
+# Fields every error response must contain
+_ERROR_FIELDS = itemgetter("error", "timestamp", "request_id")
+
+# Mock handler responses, validated once instead of per Hypothesis example
+_MOCK_RESPONSE = ChatResponse(
+    advice="Test medical advice",
+    hospitals=None,
+    confidence_level="high"
+)
+_SERVICE_CALL_RESPONSE = ChatResponse(
+    advice="Test response",
+    hospitals=None,
+    confidence_level="high"
+)
+_QUERY_RESPONSE = ChatResponse(
+    advice="Test medical advice based on your query",
+    hospitals=None,
+    confidence_level="high"
+)
+_MOCK_HOSPITAL = HospitalResult(
+    name="Test Hospital",
+    address="123 Test St",
+    distance_km=1.5,
+    place_id="test_place_id",
+    rating=4.2
+)
+_HOSPITAL_RESPONSE = ChatResponse(
+    advice="Based on your location, here's medical advice with nearby hospitals",
+    hospitals=[_MOCK_HOSPITAL],
+    confidence_level="high"
+)
+_SLOW_RESPONSE = ChatResponse(
+    advice="This response took too long",
+    hospitals=None,
+    confidence_level="low"
+)
+
+
+def nonblank_text(max_size, first=None, rest=None):
+    """Text that is never blank, built without filtering out generated examples.
+
+    The first character is drawn from non-whitespace characters, so the result
+    always survives ``str.strip()``.
+    """
+    if first is None:
+        first = st.characters(blacklist_categories=("Cs", "Zs", "Zl", "Zp", "Cc"))
+    tail = st.text(max_size=max_size - 1) if rest is None else st.text(alphabet=rest, max_size=max_size - 1)
+    return st.builds(lambda head, tail: head + tail, first, tail)
+
+
+@pytest.fixture(scope="module")
 def mock_settings():
     """Mock settings for all tests."""
     mock_settings = Mock()
@@ -34,30 +108,32 @@ def mock_settings():
     return mock_settings
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_service_manager():
-    """Mock service manager for all tests."""
-    mock_sm = Mock()
-    mock_sm.initialize_all = AsyncMock()
-    mock_sm.cleanup = AsyncMock()
-    mock_sm.get_health_status.return_value = {
-        "initialized": True,
-        "services": {
-            "vertex_ai": {"connected": True, "service": "Google Cloud Vertex AI", "model": "gemini-1.5-flash-001"},
-            "google_maps": {"connected": True, "service": "Google Maps Places API", "features": ["hospital_search", "pharmacy_search"]}
-        },
-        "all_services_healthy": True
-    }
+    """Lightweight service manager stand-in for all tests.
+
+    /health updates the returned status in place, so each call gets a copy.
+    """
+    mock_sm = SimpleNamespace(
+        initialize_all=AsyncMock(),
+        cleanup=AsyncMock(),
+        get_health_status=lambda: dict(_HEALTH_STATUS)
+    )
     return mock_sm
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_handler():
-    """Mock multimodal handler for all tests."""
-    return Mock()
+    """Mock multimodal handler for all tests.
 
+    process_request is created once; tests set its return_value or side_effect.
+    """
+    handler = Mock()
+    handler.process_request = AsyncMock()
+    return handler
 
-@pytest.fixture
+
+@pytest.fixture(scope="module")
 def test_app(mock_settings, mock_service_manager, mock_handler):
     """Create a test app with properly mocked dependencies."""
     with patch('config.settings.get_settings', return_value=mock_settings), \
@@ -74,22 +150,53 @@ def test_app(mock_settings, mock_service_manager, mock_handler):
         return app
 
 
+@pytest.fixture(scope="module")
+def client(test_app):
+    """Share one test client across all examples in this module.
+
+    The client is not entered as a context manager: the lifespan would try to
+    initialize the real Google Cloud clients, and app state is set by test_app.
+    """
+    test_client = TestClient(test_app)
+    yield test_client
+    test_client.close()
+
+
+class ListHandler(logging.Handler):
+    """Logging handler that keeps formatted records in a list."""
+    
+    def __init__(self):
+        super().__init__()
+        self.records = []
+    
+    def emit(self, record):
+        self.records.append(self.format(record))
+
+
+# Test logger and formatter are created once and shared by every log_capture use
+_TEST_LOGGER = get_logger("test")
+_TEST_FORMATTER = StructuredFormatter()
+
+
 @pytest.fixture
 def log_capture():
-    """Capture log output for testing."""
-    log_stream = StringIO()
-    handler = logging.StreamHandler(log_stream)
-    handler.setFormatter(StructuredFormatter())
+    """Capture formatted log lines for testing; join with "\n" for text."""
+    handler = ListHandler()
+    handler.setFormatter(_TEST_FORMATTER)
     
-    # Get the firstaidvox logger
-    logger = get_logger("test")
-    logger.addHandler(handler)
-    logger.setLevel(logging.INFO)
+    # Capture on the firstaidvox test logger only, without walking its ancestors
+    previous_level = _TEST_LOGGER.level
+    previous_propagate = _TEST_LOGGER.propagate
+    _TEST_LOGGER.addHandler(handler)
+    _TEST_LOGGER.setLevel(logging.INFO)
+    _TEST_LOGGER.propagate = False
     
-    yield log_stream
+    yield handler.records
     
     # Cleanup
-    logger.removeHandler(handler)
+    _TEST_LOGGER.removeHandler(handler)
+    _TEST_LOGGER.setLevel(previous_level)
+    _TEST_LOGGER.propagate = previous_propagate
 
 
 class TestComprehensiveLoggingProperty:
@@ -100,35 +207,25 @@ class TestComprehensiveLoggingProperty:
     """
 
     @given(
-        text=st.text(min_size=1, max_size=500).filter(lambda x: x.strip()),
-        endpoint=st.sampled_from(["/chat", "/health"]),
-        method=st.sampled_from(["GET", "POST"])
+        text=nonblank_text(max_size=500),
+        route=st.sampled_from([("/chat", "POST"), ("/health", "GET")])
     )
     @settings(suppress_health_check=[HealthCheck.function_scoped_fixture])
     def test_request_logging_always_includes_required_information(
-        self, text: str, endpoint: str, method: str, test_app, mock_handler, log_capture
+        self, text: str, route: tuple, client, mock_handler, log_capture
     ):
         """For any request, the system should generate appropriate log entries with required information (timestamps, endpoints, sanitized inputs, service names, response times, error details)."""
         
         # Mock successful response from handler
-        mock_response = ChatResponse(
-            advice="Test medical advice",
-            hospitals=None,
-            confidence_level="high"
-        )
-        mock_handler.process_request = AsyncMock(return_value=mock_response)
-        
-        # Create test client
-        client = TestClient(test_app)
+        mock_handler.process_request.side_effect = None
+        mock_handler.process_request.return_value = _MOCK_RESPONSE
         
-        # Make request based on endpoint and method
-        if endpoint == "/chat" and method == "POST":
-            response = client.post("/chat", data={"text": text})
-        elif endpoint == "/health" and method == "GET":
-            response = client.get("/health")
+        # Make request based on endpoint and method (only valid pairs are generated)
+        endpoint, method = route
+        if method == "POST":
+            response = client.post(endpoint, data={"text": text})
         else:
-            # Skip invalid combinations
-            return
+            response = client.get(endpoint)
         
         # Verify response was successful
         assert response.status_code in [200, 503]  # Health can return 503
@@ -142,21 +239,17 @@ class TestComprehensiveLoggingProperty:
         assert len(request_id) > 0
         assert "-" in request_id  # UUID format
         
-        # Verify response time format
+        # Verify response time format and that it is reasonable (under 10 seconds)
         response_time = response.headers["X-Response-Time"]
-        assert response_time.endswith("s")
-        time_value = float(response_time[:-1])
-        assert time_value >= 0
-        assert time_value < 10  # Should be reasonable
+        assert _UNDER_10S.fullmatch(response_time), f"Unexpected response time {response_time}"
 
     @given(
-        text=st.text(min_size=1, max_size=500).filter(lambda x: x.strip()),
+        text=nonblank_text(max_size=500),
         service_name=st.sampled_from(["vertex_ai", "google_maps", "multimodal_handler"]),
         response_time_ms=st.floats(min_value=1, max_value=5000, allow_nan=False)
     )
-    @settings(suppress_health_check=[HealthCheck.function_scoped_fixture])
     def test_external_service_call_logging_format(
-        self, text: str, service_name: str, response_time_ms: float, test_app, mock_handler
+        self, text: str, service_name: str, response_time_ms: float, client, mock_handler
     ):
         """For any external service call, the system should log the service name, request timestamp, and response time."""
         
@@ -172,16 +265,9 @@ class TestComprehensiveLoggingProperty:
                     "endpoint": "/predict" if service_name == "vertex_ai" else "/places/nearbysearch"
                 }
             )
-            return ChatResponse(
-                advice="Test response",
-                hospitals=None,
-                confidence_level="high"
-            )
+            return _SERVICE_CALL_RESPONSE
         
-        mock_handler.process_request = mock_process_with_logging
-        
-        # Create test client
-        client = TestClient(test_app)
+        mock_handler.process_request.side_effect = mock_process_with_logging
         
         # Make request
         response = client.post("/chat", data={"text": text})
@@ -194,32 +280,25 @@ class TestComprehensiveLoggingProperty:
         assert "X-Response-Time" in response.headers
 
     @given(
-        error_message=st.text(min_size=1, max_size=200).filter(lambda x: x.strip()),
+        error_message=nonblank_text(max_size=200),
         error_type=st.sampled_from(["ValidationError", "ConnectionError", "TimeoutError", "ValueError"]),
         status_code=st.sampled_from([400, 401, 403, 404, 413, 422, 500, 503])
     )
-    @settings(suppress_health_check=[HealthCheck.function_scoped_fixture])
     def test_error_logging_includes_required_context(
-        self, error_message: str, error_type: str, status_code: int, test_app, mock_handler
+        self, error_message: str, error_type: str, status_code: int, client, mock_handler
     ):
         """For any error, the system should log the error message, stack trace, and request context."""
         
         # Mock handler to raise an error
-        from fastapi import HTTPException
-        mock_handler.process_request = AsyncMock(
-            side_effect=HTTPException(
-                status_code=status_code,
-                detail={
-                    "code": error_type.upper(),
-                    "message": error_message,
-                    "details": {"error_type": error_type}
-                }
-            )
+        mock_handler.process_request.side_effect = HTTPException(
+            status_code=status_code,
+            detail={
+                "code": error_type.upper(),
+                "message": error_message,
+                "details": {"error_type": error_type}
+            }
         )
         
-        # Create test client
-        client = TestClient(test_app)
-        
         # Make request that will trigger error
         response = client.post("/chat", data={"text": "test query"})
         
@@ -230,43 +309,35 @@ class TestComprehensiveLoggingProperty:
         error_data = response.json()
         
         # Verify required error fields are present
-        required_fields = ["error", "timestamp", "request_id"]
-        for field in required_fields:
-            assert field in error_data, f"Missing error field: {field}"
+        try:
+            error_detail, timestamp, request_id = _ERROR_FIELDS(error_data)
+        except KeyError as missing:
+            pytest.fail(f"Missing error field: {missing}")
         
         # Verify error structure
-        error_detail = error_data["error"]
         assert error_detail["code"] == error_type.upper()
         assert error_detail["message"] == error_message
         
         # Verify request ID is present in error response
-        assert isinstance(error_data["request_id"], str)
-        assert len(error_data["request_id"]) > 0
+        assert isinstance(request_id, str)
+        assert len(request_id) > 0
         
         # Verify timestamp is present
-        assert isinstance(error_data["timestamp"], str)
+        assert isinstance(timestamp, str)
 
     @given(
-        text=st.text(min_size=1, max_size=500).filter(lambda x: x.strip()),
+        text=nonblank_text(max_size=500),
         client_ip=st.ip_addresses().map(str),
-        user_agent=st.text(min_size=1, max_size=200, alphabet=st.characters(min_codepoint=32, max_codepoint=126)).filter(lambda x: x.strip())
+        user_agent=nonblank_text(max_size=200, first=st.characters(min_codepoint=33, max_codepoint=126), rest=st.characters(min_codepoint=32, max_codepoint=126))
     )
-    @settings(suppress_health_check=[HealthCheck.function_scoped_fixture])
     def test_request_context_logging_sanitization(
-        self, text: str, client_ip: str, user_agent: str, test_app, mock_handler
+        self, text: str, client_ip: str, user_agent: str, client, mock_handler
     ):
         """For any request, the system should log sanitized input summary without exposing sensitive data."""
         
         # Mock successful response
-        mock_response = ChatResponse(
-            advice="Test medical advice",
-            hospitals=None,
-            confidence_level="high"
-        )
-        mock_handler.process_request = AsyncMock(return_value=mock_response)
-        
-        # Create test client
-        client = TestClient(test_app)
+        mock_handler.process_request.side_effect = None
+        mock_handler.process_request.return_value = _MOCK_RESPONSE
         
         # Make request with headers
         response = client.post(
@@ -286,59 +357,48 @@ class TestComprehensiveLoggingProperty:
         request_id = response.headers["X-Request-ID"]
         assert len(request_id.split("-")) >= 4  # UUID format has dashes
         
-        # Verify response time is reasonable
+        # Verify response time is reasonable for test (under 10 seconds)
         response_time_str = response.headers["X-Response-Time"]
-        response_time = float(response_time_str.rstrip("s"))
-        assert 0 <= response_time <= 10  # Should be reasonable for test
+        assert _UNDER_10S.fullmatch(response_time_str), f"Unexpected response time {response_time_str}"
 
     @given(
         num_requests=st.integers(min_value=1, max_value=5),
         text_inputs=st.lists(
-            st.text(min_size=1, max_size=100).filter(lambda x: x.strip()),
+            nonblank_text(max_size=100),
             min_size=1,
             max_size=5
         )
     )
-    @settings(suppress_health_check=[HealthCheck.function_scoped_fixture])
     def test_concurrent_request_logging_uniqueness(
-        self, num_requests: int, text_inputs: list, test_app, mock_handler
+        self, num_requests: int, text_inputs: list, client, mock_handler
     ):
         """For any concurrent requests, each should have unique request IDs and proper logging."""
         
         # Mock successful response
-        mock_response = ChatResponse(
-            advice="Test medical advice",
-            hospitals=None,
-            confidence_level="high"
-        )
-        mock_handler.process_request = AsyncMock(return_value=mock_response)
-        
-        # Create test client
-        client = TestClient(test_app)
+        mock_handler.process_request.side_effect = None
+        mock_handler.process_request.return_value = _MOCK_RESPONSE
         
         # Make multiple requests
-        responses = []
-        request_ids = set()
+        responses = [
+            client.post("/chat", data={"text": text_inputs[i]})
+            for i in range(min(num_requests, len(text_inputs)))
+        ]
         
-        for i in range(min(num_requests, len(text_inputs))):
-            response = client.post("/chat", data={"text": text_inputs[i]})
-            responses.append(response)
-            
-            # Verify response was successful
+        # Verify all responses were successful and carry tracking headers
+        for response in responses:
             assert response.status_code == 200
-            
-            # Collect request IDs
-            request_id = response.headers.get("X-Request-ID")
-            assert request_id is not None
-            request_ids.add(request_id)
+            assert "X-Request-ID" in response.headers
+            assert "X-Response-Time" in response.headers
         
         # Verify all request IDs are unique
-        assert len(request_ids) == len(responses)
+        request_ids = [response.headers["X-Request-ID"] for response in responses]
+        assert len(set(request_ids)) == len(request_ids)
+
+    def test_structured_logging_accepts_non_string_keys(self, log_capture):
+        """Extra fields holding dicts with non-str keys should still produce a JSON log line."""
+        _TEST_LOGGER.info("Key types", extra={"input_summary": {1: "one", 2.5: "two"}})
         
-        # Verify all responses have proper headers
-        for response in responses:
-            assert "X-Request-ID" in response.headers
-            assert "X-Response-Time" in response.headers
+        assert json.loads(log_capture[-1])["input_summary"] == {"1": "one", "2.5": "two"}
 
 
 class TestResponseTimePerformanceProperty:
@@ -346,44 +406,42 @@ class TestResponseTimePerformanceProperty:
     
     **Feature: firstaidvox-backend, Property 2: Response time performance**
     **Validates: Requirements 1.5**
+    
+    Mock handlers await a recording AsyncMock instead of asyncio.sleep, so the
+    measured time is the request overhead alone and is checked against what the
+    3 second budget leaves after the simulated service delay.
     """
 
     @given(
-        text=st.text(min_size=1, max_size=2000).filter(lambda x: x.strip()),
+        text=nonblank_text(max_size=2000),
         processing_delay=st.floats(min_value=0.001, max_value=2.5, allow_nan=False)
     )
-    @settings(suppress_health_check=[HealthCheck.function_scoped_fixture], deadline=None)
+    @settings(deadline=None)
     def test_medical_query_response_time_under_limit(
-        self, text: str, processing_delay: float, test_app, mock_handler
+        self, text: str, processing_delay: float, client, mock_handler
     ):
         """For any medical query input, the system should return a complete response within 3 seconds."""
         
-        # Mock handler with controlled delay
-        async def delayed_process(text, location=None, image=None):
-            await asyncio.sleep(processing_delay)
-            return ChatResponse(
-                advice="Test medical advice based on your query",
-                hospitals=None,
-                confidence_level="high"
-            )
+        # Mock handler with controlled (simulated) delay
+        simulated_sleep = AsyncMock()
         
-        mock_handler.process_request = delayed_process
+        async def delayed_process(text, location=None, image=None):
+            await simulated_sleep(processing_delay)
+            return _QUERY_RESPONSE
         
-        # Create test client
-        client = TestClient(test_app)
+        mock_handler.process_request.side_effect = delayed_process
         
-        # Measure response time
-        start_time = time.time()
+        # Measure the request overhead; the simulated delay is not slept
+        start_time = time.perf_counter()
         response = client.post("/chat", data={"text": text})
-        end_time = time.time()
+        overhead = time.perf_counter() - start_time
         
-        actual_response_time = end_time - start_time
-        
-        # Verify response was successful
+        # Verify response was successful and the handler awaited the simulated delay
         assert response.status_code == 200
+        simulated_sleep.assert_awaited_once_with(processing_delay)
         
-        # Verify response time is within limit (3 seconds + some tolerance for test overhead)
-        assert actual_response_time < 4.0, f"Response time {actual_response_time:.3f}s exceeds limit"
+        # Verify the app's own overhead leaves the simulated delay within the 3 second limit
+        assert overhead < _OVERHEAD_LIMIT_SECONDS, f"Request overhead {overhead:.3f}s exceeds limit"
         
         # Verify response contains required fields
         response_data = response.json()
@@ -394,56 +452,35 @@ class TestResponseTimePerformanceProperty:
         # Verify response time header is present and reasonable
         response_time_header = response.headers.get("X-Response-Time")
         assert response_time_header is not None
-        assert response_time_header.endswith("s")
         
-        header_time = float(response_time_header[:-1])
-        # Header time should be reasonable (may be rounded to 0.0 for very fast responses)
-        assert header_time >= 0
-        assert header_time < 4.0
+        # Header time should be reasonable (may be rounded to 0.000s for very fast responses)
+        assert _UNDER_4S.fullmatch(response_time_header), f"Unexpected response time {response_time_header}"
 
     @given(
-        text=st.text(min_size=1, max_size=500).filter(lambda x: x.strip()),
+        text=nonblank_text(max_size=500),
         latitude=st.floats(min_value=-90, max_value=90, allow_nan=False, allow_infinity=False),
         longitude=st.floats(min_value=-180, max_value=180, allow_nan=False, allow_infinity=False),
         hospital_search_delay=st.floats(min_value=0.1, max_value=2.0, allow_nan=False)
     )
-    @settings(suppress_health_check=[HealthCheck.function_scoped_fixture], deadline=None)
+    @settings(deadline=None)
     def test_multimodal_with_location_response_time(
         self, text: str, latitude: float, longitude: float, 
-        hospital_search_delay: float, test_app, mock_handler
+        hospital_search_delay: float, client, mock_handler
     ):
         """For any multimodal query with location, including hospital search, response time should be within limits."""
         
-        from app.models.hospital import HospitalResult
-        
         # Mock handler with hospital search simulation
+        simulated_sleep = AsyncMock()
+        
         async def process_with_hospital_search(text, location=None, image=None):
             # Simulate hospital search delay
-            await asyncio.sleep(hospital_search_delay)
-            
-            hospitals = [
-                HospitalResult(
-                    name="Test Hospital",
-                    address="123 Test St",
-                    distance_km=1.5,
-                    place_id="test_place_id",
-                    rating=4.2
-                )
-            ]
-            
-            return ChatResponse(
-                advice="Based on your location, here's medical advice with nearby hospitals",
-                hospitals=hospitals,
-                confidence_level="high"
-            )
-        
-        mock_handler.process_request = process_with_hospital_search
+            await simulated_sleep(hospital_search_delay)
+            return _HOSPITAL_RESPONSE
         
-        # Create test client
-        client = TestClient(test_app)
+        mock_handler.process_request.side_effect = process_with_hospital_search
         
-        # Measure response time for multimodal request
-        start_time = time.time()
+        # Measure the request overhead for a multimodal request
+        start_time = time.perf_counter()
         response = client.post(
             "/chat", 
             data={
@@ -452,15 +489,14 @@ class TestResponseTimePerformanceProperty:
                 "longitude": longitude
             }
         )
-        end_time = time.time()
-        
-        actual_response_time = end_time - start_time
+        overhead = time.perf_counter() - start_time
         
-        # Verify response was successful
+        # Verify response was successful and the hospital search delay was awaited
         assert response.status_code == 200
+        simulated_sleep.assert_awaited_once_with(hospital_search_delay)
         
-        # Verify response time is within limit even with hospital search
-        assert actual_response_time < 4.0, f"Multimodal response time {actual_response_time:.3f}s exceeds limit"
+        # Verify the overhead leaves the hospital search delay within the 3 second limit
+        assert overhead < _OVERHEAD_LIMIT_SECONDS, f"Multimodal request overhead {overhead:.3f}s exceeds limit"
         
         # Verify response contains both advice and hospital data
         response_data = response.json()
@@ -479,83 +515,66 @@ class TestResponseTimePerformanceProperty:
         num_concurrent=st.integers(min_value=2, max_value=5),
         base_delay=st.floats(min_value=0.1, max_value=1.0, allow_nan=False)
     )
-    @settings(suppress_health_check=[HealthCheck.function_scoped_fixture], deadline=None)
+    @settings(deadline=None)
     def test_concurrent_requests_performance(
         self, num_concurrent: int, base_delay: float, test_app, mock_handler
     ):
         """For any number of concurrent requests, each should complete within the time limit."""
         
-        # Mock handler with base delay
+        # Mock handler with base (simulated) delay
+        simulated_sleep = AsyncMock()
+        
         async def delayed_process(text, location=None, image=None):
-            await asyncio.sleep(base_delay)
+            await simulated_sleep(base_delay)
             return ChatResponse(
                 advice=f"Medical advice for: {text[:50]}...",
                 hospitals=None,
                 confidence_level="medium"
             )
         
-        mock_handler.process_request = delayed_process
+        mock_handler.process_request.side_effect = delayed_process
         
-        # Create test client
-        client = TestClient(test_app)
+        # Issue the requests concurrently on one event loop
+        async def make_request(ac, request_id):
+            start_time = time.monotonic()
+            response = await ac.post("/chat", data={"text": f"Emergency query {request_id}"})
+            return {
+                "request_id": request_id,
+                "response": response,
+                "overhead": time.monotonic() - start_time
+            }
         
-        # Prepare concurrent requests
-        import threading
-        import queue
+        async def run_concurrent_requests():
+            transport = httpx.ASGITransport(app=test_app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as ac:
+                return await asyncio.gather(
+                    *(make_request(ac, i) for i in range(num_concurrent))
+                )
         
-        results_queue = queue.Queue()
+        results = asyncio.run(run_concurrent_requests())
         
-        def make_request(request_id):
-            start_time = time.time()
-            response = client.post("/chat", data={"text": f"Emergency query {request_id}"})
-            end_time = time.time()
-            
-            results_queue.put({
-                "request_id": request_id,
-                "response": response,
-                "response_time": end_time - start_time
-            })
-        
-        # Start concurrent requests
-        threads = []
-        for i in range(num_concurrent):
-            thread = threading.Thread(target=make_request, args=(i,))
-            threads.append(thread)
-            thread.start()
-        
-        # Wait for all requests to complete
-        for thread in threads:
-            thread.join(timeout=10)  # 10 second timeout for safety
-        
-        # Collect results
-        results = []
-        while not results_queue.empty():
-            results.append(results_queue.get())
-        
-        # Verify all requests completed
+        # Verify all requests completed and each awaited the simulated delay
         assert len(results) == num_concurrent
+        assert simulated_sleep.await_count == num_concurrent
+        assert all(call.args == (base_delay,) for call in simulated_sleep.await_args_list)
         
         # Verify each request met performance requirements
         for result in results:
             assert result["response"].status_code == 200
-            assert result["response_time"] < 4.0, f"Request {result['request_id']} took {result['response_time']:.3f}s"
+            assert result["overhead"] < _OVERHEAD_LIMIT_SECONDS, f"Request {result['request_id']} overhead {result['overhead']:.3f}s"
             
             # Verify response has proper headers
             assert "X-Request-ID" in result["response"].headers
             assert "X-Response-Time" in result["response"].headers
 
     @given(
-        text=st.text(min_size=1, max_size=100).filter(lambda x: x.strip())
+        text=nonblank_text(max_size=100)
     )
-    @settings(suppress_health_check=[HealthCheck.function_scoped_fixture])
     def test_health_endpoint_response_time(
-        self, text: str, test_app
+        self, text: str, client
     ):
         """For any health check request, response time should be minimal and well under limits."""
         
-        # Create test client
-        client = TestClient(test_app)
-        
         # Measure health endpoint response time
         start_time = time.time()
         response = client.get("/health")
@@ -579,31 +598,25 @@ class TestResponseTimePerformanceProperty:
         # Verify response time header
         response_time_header = response.headers.get("X-Response-Time")
         assert response_time_header is not None
-        header_time = float(response_time_header[:-1])
-        assert header_time < 1.0
+        assert _UNDER_1S.fullmatch(response_time_header), f"Unexpected response time {response_time_header}"
 
     @given(
         processing_time=st.floats(min_value=3.1, max_value=10.0, allow_nan=False)
     )
-    @settings(suppress_health_check=[HealthCheck.function_scoped_fixture], deadline=None)
+    @settings(deadline=None)
     def test_timeout_handling_for_slow_responses(
-        self, processing_time: float, test_app, mock_handler
+        self, processing_time: float, client, mock_handler
     ):
         """For any request that would exceed time limits, the system should handle it appropriately."""
         
-        # Mock handler with excessive delay
-        async def slow_process(text, location=None, image=None):
-            await asyncio.sleep(processing_time)
-            return ChatResponse(
-                advice="This response took too long",
-                hospitals=None,
-                confidence_level="low"
-            )
+        # Mock handler with excessive (simulated) delay
+        simulated_sleep = AsyncMock()
         
-        mock_handler.process_request = slow_process
+        async def slow_process(text, location=None, image=None):
+            await simulated_sleep(processing_time)
+            return _SLOW_RESPONSE
         
-        # Create test client with timeout
-        client = TestClient(test_app)
+        mock_handler.process_request.side_effect = slow_process
         
         # Make request that will be slow
         start_time = time.time()
@@ -626,4 +639,7 @@ class TestResponseTimePerformanceProperty:
         except Exception:
             # Timeout or connection error is acceptable for very slow requests
             # The important thing is that the system doesn't crash
-            pass
\ No newline at end of file
+            pass
+        
+        # The handler was reached with the requested delay, without blocking on it
+        simulated_sleep.assert_awaited_once_with(processing_time)
\ No newline at end of file
@@ -2,7 +2,7 @@
 
 import pytest
 from datetime import datetime
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
 
 from app.models import (
     ChatRequest, ChatResponse, Location, HospitalResult, 
@@ -10,85 +10,122 @@ from app.models import (
 )
 
 
+# Adapters are built once and reused; they run the same validator as model_validate
+LOCATION_TA = TypeAdapter(Location)
+HOSPITAL_TA = TypeAdapter(HospitalResult)
+CHAT_REQUEST_TA = TypeAdapter(ChatRequest)
+CHAT_RESPONSE_TA = TypeAdapter(ChatResponse)
+FUNCTION_CALL_TA = TypeAdapter(FunctionCall)
+AI_RESPONSE_TA = TypeAdapter(AIResponse)
+ERROR_RESPONSE_TA = TypeAdapter(ErrorResponse)
+
+
 class TestBasicModelInstantiation:
     """Basic tests to verify models can be instantiated correctly."""
 
-    def test_location_creation(self):
-        """Test Location model can be created with valid coordinates."""
-        location = Location(latitude=37.7749, longitude=-122.4194)
-        assert location.latitude == 37.7749
-        assert location.longitude == -122.4194
+    @pytest.mark.parametrize("adapter,data,defaulted", [
+        pytest.param(
+            LOCATION_TA,
+            {"latitude": 37.7749, "longitude": -122.4194},
+            {},
+            id="location"
+        ),
+        pytest.param(
+            HOSPITAL_TA,
+            {
+                "name": "Test Hospital",
+                "address": "123 Test St",
+                "distance_km": 2.5,
+                "place_id": "test_place_id",
+                "rating": 4.2
+            },
+            {},
+            id="hospital_result"
+        ),
+        pytest.param(
+            CHAT_REQUEST_TA,
+            {
+                "text": "I have a medical emergency",
+                "location": {"latitude": 37.7749, "longitude": -122.4194}
+            },
+            {},
+            id="chat_request"
+        ),
+        pytest.param(
+            CHAT_RESPONSE_TA,
+            {
+                "advice": "Apply pressure to the wound",
+                "hospitals": [{
+                    "name": "Test Hospital",
+                    "address": "123 Test St",
+                    "distance_km": 2.5,
+                    "place_id": "test_place_id"
+                }],
+                "confidence_level": "high"
+            },
+            {"timestamp": datetime},
+            id="chat_response"
+        ),
+        pytest.param(
+            FUNCTION_CALL_TA,
+            {
+                "name": "search_hospitals",
+                "parameters": {"latitude": 37.7749, "longitude": -122.4194}
+            },
+            {},
+            id="function_call"
+        ),
+        pytest.param(
+            AI_RESPONSE_TA,
+            {
+                "text": "Let me find hospitals for you",
+                "function_calls": [{"name": "search_hospitals", "parameters": {}}]
+            },
+            {},
+            id="ai_response"
+        ),
+        pytest.param(
+            ERROR_RESPONSE_TA,
+            {
+                "error": {
+                    "code": "INVALID_INPUT",
+                    "message": "Invalid coordinates",
+                    "details": {"latitude": "out of range"}
+                },
+                "request_id": "req_123"
+            },
+            {"timestamp": datetime},
+            id="error_response"
+        ),
+    ])
+    def test_model_creation(self, adapter, data, defaulted):
+        """Test each model can be created from valid data and keeps the given values.
 
-    def test_hospital_result_creation(self):
-        """Test HospitalResult model can be created with valid data."""
-        hospital = HospitalResult(
-            name="Test Hospital",
-            address="123 Test St",
-            distance_km=2.5,
-            place_id="test_place_id",
-            rating=4.2
-        )
-        assert hospital.name == "Test Hospital"
-        assert hospital.distance_km == 2.5
-        assert hospital.rating == 4.2
+        ``defaulted`` maps fields filled in by the model to their expected type.
+        """
+        instance = adapter.validate_python(data)
+        
+        # Every provided field (including nested models) round-trips unchanged
+        assert instance.model_dump(exclude_unset=True) == data
+        
+        for field, expected_type in defaulted.items():
+            assert isinstance(getattr(instance, field), expected_type)
 
-    def test_chat_request_creation(self):
-        """Test ChatRequest model can be created with valid data."""
-        location = Location(latitude=37.7749, longitude=-122.4194)
-        request = ChatRequest(
-            text="I have a medical emergency",
-            location=location
-        )
-        assert request.text == "I have a medical emergency"
-        assert request.location.latitude == 37.7749
-
-    def test_chat_response_creation(self):
-        """Test ChatResponse model can be created with valid data."""
-        hospital = HospitalResult(
-            name="Test Hospital",
-            address="123 Test St", 
-            distance_km=2.5,
-            place_id="test_place_id"
-        )
+    def test_direct_model_construction(self):
+        """Test keyword construction validates nested models and fills defaults."""
         response = ChatResponse(
             advice="Apply pressure to the wound",
-            hospitals=[hospital],
+            hospitals=[HospitalResult(
+                name="Test Hospital",
+                address="123 Test St",
+                distance_km=2.5,
+                place_id="test_place_id"
+            )],
             confidence_level="high"
         )
-        assert response.advice == "Apply pressure to the wound"
-        assert len(response.hospitals) == 1
-        assert response.confidence_level == "high"
+        
+        assert response.hospitals[0].name == "Test Hospital"
         assert isinstance(response.timestamp, datetime)
-
-    def test_function_call_creation(self):
-        """Test FunctionCall model can be created with valid data."""
-        func_call = FunctionCall(
-            name="search_hospitals",
-            parameters={"latitude": 37.7749, "longitude": -122.4194}
-        )
-        assert func_call.name == "search_hospitals"
-        assert func_call.parameters["latitude"] == 37.7749
-
-    def test_ai_response_creation(self):
-        """Test AIResponse model can be created with valid data."""
-        func_call = FunctionCall(name="search_hospitals", parameters={})
-        ai_response = AIResponse(
-            text="Let me find hospitals for you",
-            function_calls=[func_call]
-        )
-        assert ai_response.text == "Let me find hospitals for you"
-        assert len(ai_response.function_calls) == 1
-
-    def test_error_response_creation(self):
-        """Test ErrorResponse model can be created with valid data."""
-        error_response = ErrorResponse(
-            error={
-                "code": "INVALID_INPUT",
-                "message": "Invalid coordinates",
-                "details": {"latitude": "out of range"}
-            },
-            request_id="req_123"
-        )
-        assert error_response.error["code"] == "INVALID_INPUT"
-        assert error_response.request_id == "req_123"
-        assert isinstance(error_response.timestamp, datetime)
\ No newline at end of file
+        
+        with pytest.raises(ValidationError):
+            Location(latitude=91.0, longitude=0.0)